@@ -119,7 +119,7 @@ def run_keyboard_test() -> None:
                 print("Exiting keyboard test.")
                 break
             raw = _escape_bytes(ev.raw)
-            parts = [f"type={ev.key_type.value}", f"value={ev.value}", f"raw='{raw}'"]
+            parts = [f"type={ev.key_type.name.lower()}", f"value={ev.value}", f"raw='{raw}'"]
             flags = []
             if ev.is_alt:
                 flags.append('alt')
@@ -131,8 +131,6 @@ def run_keyboard_test() -> None:
                 flags.append('seq')
             if flags:
                 parts.append(f"flags={'+'.join(flags)}")
-            if ev.code is not None:
-                parts.append(f"code={ev.code}")
             print(' '.join(parts))
     finally:
         # Restore termios and cleanup terminal
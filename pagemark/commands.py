@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from typing import Dict, Tuple, Optional, TYPE_CHECKING
 from .keyboard import KeyType
 from .autosave import delete_swap_file
+from .undo import UndoEntry
 
 if TYPE_CHECKING:
     from .editor import Editor
@@ -116,11 +117,12 @@ class EditCommand(EditorCommand):
         """Editing commands modify the document."""
         # Capture snapshot before edit
         before = editor._snapshot_state()
-        self._edit(editor, key_event)
+        # Compound edits (e.g. replace selection, then insert) redraw once
+        with editor.model.batch():
+            self._edit(editor, key_event)
         # Capture snapshot after edit and push to undo stack
         after = editor._snapshot_state()
         try:
-            from .undo import UndoEntry
             editor.undo.push(UndoEntry(before=before, after=after))
         except Exception:
             # Justification: Undo persistence should never break editing.
@@ -282,17 +284,20 @@ class SelectionMovementCommand(MovementCommand):
     """
 
     def execute(self, editor: 'Editor', key_event: 'KeyEvent') -> bool:
-        # Start selection if not already started
-        if editor.model.selection_start is None:
-            editor.model.start_selection()
-
-        # Perform the movement without clearing selection
-        self._selection_move(editor, key_event)
-
-        # Update selection end to current cursor and draw
-        editor.model.update_selection_end()
+        model = editor.model
+        # The movement's own render is deferred so the view is drawn once,
+        # with the updated selection
+        with model.batch():
+            # Start selection if not already started
+            if model.selection_start is None:
+                model.start_selection()
+
+            # Perform the movement without clearing selection
+            self._selection_move(editor, key_event)
+
+            # Update selection end to current cursor; this draws the view
+            model.update_selection_end()
         editor.view.update_desired_x()
-        editor.view.render()
         return False
 
     def _selection_move(self, editor, key_event):
@@ -367,6 +372,10 @@ class CommandRegistry:
     
     def __init__(self):
         self._commands: Dict[Tuple[KeyType, str], EditorCommand] = {}
+        # Fallbacks for unregistered regular keys; commands are stateless,
+        # so build them once rather than on every typed character
+        self._tab_command = TabCommand()
+        self._insert_text_command = InsertTextCommand()
         self._setup_default_commands()
     
     def _setup_default_commands(self):
@@ -441,9 +450,6 @@ class CommandRegistry:
 
     def get_command(self, key_type: KeyType, value: str) -> Optional[EditorCommand]:
         """Get the command for a key combination."""
-        # For Alt-modified keys, check both with and without Alt flag
-        if key_type == KeyType.ALT:
-            return self._commands.get((KeyType.ALT, value))
         return self._commands.get((key_type, value))
 
     def execute(self, editor: 'Editor', key_event: 'KeyEvent') -> bool:
@@ -452,22 +458,19 @@ class CommandRegistry:
         Returns:
             True if the document was modified
         """
-        # Check for Alt-modified keys
-        if key_event.is_alt:
-            command = self.get_command(KeyType.ALT, key_event.value)
-        else:
-            command = self.get_command(key_event.key_type, key_event.value)
+        # Alt-modified keys are bound under KeyType.ALT; one probe either way
+        key_type = KeyType.ALT if key_event.is_alt else key_event.key_type
+        command = self._commands.get((key_type, key_event.value))
         
         if command:
             return command.execute(editor, key_event)
         
-        # Handle Tab specially
-        if key_event.key_type == KeyType.REGULAR and key_event.value == '\t':
-            return TabCommand().execute(editor, key_event)
-        
-        # Handle regular text input
         if key_event.key_type == KeyType.REGULAR:
-            return InsertTextCommand().execute(editor, key_event)
+            # Handle Tab specially
+            if key_event.value == '\t':
+                return self._tab_command.execute(editor, key_event)
+            # Handle regular text input
+            return self._insert_text_command.execute(editor, key_event)
         
         return False
 
@@ -508,13 +511,9 @@ class ToggleStyleCommand(EditCommand):
     def _toggle_selection_style(self, model, flag: int):
         """Toggle style flag for the current selection."""
         # Normalize selection
-        start = model.selection_start
-        end = model.selection_end
-        if (start.paragraph_index > end.paragraph_index or
-            (start.paragraph_index == end.paragraph_index and start.character_index > end.character_index)):
-            start, end = end, start
+        start, end = model.ordered_selection()
         
-        model._sync_styles_length()
+        model._sync_style_rows(start.paragraph_index, end.paragraph_index)
         
         # Check if all selected characters have the flag
         all_have = self._check_all_have_flag(model, start, end, flag)
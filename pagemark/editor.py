@@ -18,9 +18,8 @@ from .print_formatter import PrintFormatter
 from .keyboard import KeyboardHandler, KeyEvent, KeyType
 from .constants import EditorConstants
 from .commands import CommandRegistry
-from .undo import UndoManager, ModelSnapshot, UndoEntry
+from .undo import UndoManager, ModelSnapshot, share_style_rows
 from .session import get_session, SessionKeys
-from .font_config import get_font_config
 from .autosave import write_swap_file, delete_swap_file
 
 
@@ -49,6 +48,7 @@ class Editor:
         self.command_registry = CommandRegistry()  # Command pattern for key handling
         self.running = False
         self.error_mode = False  # True when terminal is too narrow
+        self._rendered_once = False  # Cleared to force a full re-render
         # Create pipe for resize signaling
         self._resize_pipe_r, self._resize_pipe_w = os.pipe()
         # File handling
@@ -60,6 +60,8 @@ class Editor:
         self.help_visible = False  # Track if help screen is visible
         # Undo/redo
         self.undo = UndoManager()
+        # Most recent snapshot; its unchanged style rows are shared by the next
+        self._last_snapshot: Optional[ModelSnapshot] = None
         # Incremental search state
         self._isearch_origin = None  # tuple[int,int] of original cursor
         self._isearch_last_match = None  # tuple[int,int] of last match start
@@ -183,7 +185,7 @@ class Editor:
                             was_error = self.error_mode
                             self.error_mode = False
                             # Render when transitioning out of error mode, first time, or after resize
-                            if was_error or not hasattr(self, '_rendered_once'):
+                            if was_error or not self._rendered_once:
                                 self.view.render()
                                 self._rendered_once = True
                             # Draw current state
@@ -207,8 +209,7 @@ class Editor:
                         os.read(self._resize_pipe_r, 1024)
                         if self.running:
                             # Force re-render on resize
-                            if hasattr(self, '_rendered_once'):
-                                delattr(self, '_rendered_once')
+                            self._rendered_once = False
                             need_draw = True
                     elif 0 in ready:
                         # Handle input (non-blocking since select says it's ready)
@@ -292,16 +293,22 @@ class Editor:
         )
 
     def _snapshot_state(self) -> ModelSnapshot:
-        # Copy paragraphs and styles (deep copy masks)
+        # Paragraph strings are immutable and shared; style masks are copied,
+        # except that rows equal to the previous snapshot's reuse its copy.
+        # Snapshot rows are never mutated (_apply_snapshot copies them back),
+        # so successive undo entries hold only the rows an edit touched.
         paragraphs_copy = list(self.model.paragraphs)
-        styles_copy = [list(row) for row in getattr(self.model, 'styles', [])]
+        styles_copy = share_style_rows(
+            getattr(self.model, 'styles', []),
+            self._last_snapshot.styles if self._last_snapshot is not None else None,
+        )
         cp = self.model.cursor_position
         sel_start = self.model.selection_start
         sel_end = self.model.selection_end
         start_tuple = None if sel_start is None else (sel_start.paragraph_index, sel_start.character_index)
         end_tuple = None if sel_end is None else (sel_end.paragraph_index, sel_end.character_index)
         caret_style = getattr(self.model, 'caret_style', 0)
-        return ModelSnapshot(
+        snap = ModelSnapshot(
             paragraphs=paragraphs_copy,
             styles=styles_copy,
             caret_style=caret_style,
@@ -310,6 +317,8 @@ class Editor:
             selection_start=start_tuple,
             selection_end=end_tuple,
         )
+        self._last_snapshot = snap
+        return snap
 
     def _apply_snapshot(self, snap: ModelSnapshot):
         # Restore model state and redraw
@@ -414,8 +423,7 @@ class Editor:
         """Hide the help screen and return to editor."""
         self.help_visible = False
         # Force re-render
-        if hasattr(self, '_rendered_once'):
-            delattr(self, '_rendered_once')
+        self._rendered_once = False
         # Invalidate terminal frame since help drew directly to screen
         self.terminal.invalidate_frame()
 
@@ -862,6 +870,8 @@ class Editor:
         except AttributeError:
             # Dialog may not have double_spacing attribute in older versions
             pass
+        # Reuse the editor's handler so its parsed-key cache carries over
+        dialog.keyboard = self.keyboard
         result = dialog.show()
 
         # Process the result
@@ -922,8 +932,7 @@ class Editor:
         # The dialog draws outside the editor's managed frame, so invalidate
         # the cached frame and force a re-render on the next loop iteration.
         self.terminal.invalidate_frame()
-        if hasattr(self, '_rendered_once'):
-            delattr(self, '_rendered_once')
+        self._rendered_once = False
 
     def _print_to_printer(self, pages, printer_name, double_sided, page_runs=None, font_name="Courier"):
         """Submit print job to printer.
@@ -5,7 +5,8 @@ including their pitch, dimensions, and PDF generation settings.
 """
 
 from dataclasses import dataclass
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 
 # Physical page constants (US Letter)
@@ -112,20 +113,24 @@ class FontConfig:
 
 
 # Pre-defined font configurations
-FONT_CONFIGS: Dict[str, FontConfig] = {
-    "Courier": FontConfig.create_10_pitch(
-        name="Courier",
-        pdf_name="Courier",
-        pdf_bold_name="Courier-Bold",
-        is_embedded=False  # Built-in PDF font, referenced not embedded
-    ),
-    "Prestige Elite Std": FontConfig.create_12_pitch(
-        name="Prestige Elite Std",
-        pdf_name="PrestigeEliteStd",
-        pdf_bold_name="PrestigeEliteStd-Bold",
-        is_embedded=True  # Custom font, must be embedded
-    )
-}
+COURIER = FontConfig.create_10_pitch(
+    name="Courier",
+    pdf_name="Courier",
+    pdf_bold_name="Courier-Bold",
+    is_embedded=False  # Built-in PDF font, referenced not embedded
+)
+PRESTIGE_ELITE = FontConfig.create_12_pitch(
+    name="Prestige Elite Std",
+    pdf_name="PrestigeEliteStd",
+    pdf_bold_name="PrestigeEliteStd-Bold",
+    is_embedded=True  # Custom font, must be embedded
+)
+
+# Read-only view so callers cannot add or replace configurations at runtime
+FONT_CONFIGS: Mapping[str, FontConfig] = MappingProxyType({
+    COURIER.name: COURIER,
+    PRESTIGE_ELITE.name: PRESTIGE_ELITE,
+})
 
 
 def get_font_config(font_name: str) -> Optional[FontConfig]:
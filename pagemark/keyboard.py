@@ -1,22 +1,38 @@
-"""Keyboard input handling using curtsies-style tokens."""
+"""Keyboard input handling using curtsies-style tokens.
 
+Matching raw terminal bytes against escape sequences is done by curtsies'
+Input, which already resolves them with its own prefix lookup. This module
+only maps the resulting token names (e.g. '<Esc+LEFT>') and single
+characters to KeyEvents, almost always with one table lookup.
+"""
+
+import string
+from functools import lru_cache
 from typing import Optional
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
+
 
+class KeyType(IntEnum):
+    """Types of key events.
 
-class KeyType(Enum):
-    """Types of key events."""
-    REGULAR = "regular"
-    ALT = "alt"
-    CTRL = "ctrl"
-    SPECIAL = "special"
-    SHIFT_SPECIAL = "shift_special"  # Shift + arrow keys, etc.
+    Integer-valued so dispatch comparisons and hashing stay cheap; use
+    ``.name`` for a readable label.
+    """
+    REGULAR = 0
+    ALT = 1
+    CTRL = 2
+    SPECIAL = 3
+    SHIFT_SPECIAL = 4  # Shift + arrow keys, etc.
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class KeyEvent:
-    """Represents a parsed keyboard event."""
+    """Represents a parsed keyboard event.
+
+    Events are immutable so that parsed instances can be shared between
+    keypresses by the lookup tables below.
+    """
     key_type: KeyType
     value: str  # The base key (e.g., 'a', 'left', 'backspace')
     raw: str  # The raw key string from blessed
@@ -24,128 +40,209 @@ class KeyEvent:
     is_ctrl: bool = False
     is_shift: bool = False
     is_sequence: bool = False
-    code: Optional[int] = None
+    code: Optional[int] = None  # Never set by the curtsies parser
 
 
 class KeyboardHandler:
     """Handles keyboard input using curtsies-style key names."""
     
-    # No raw control mapping; curtsies tokens are used exclusively
+    # Upper bound on memoized token parses; curtsies emits a small, bounded
+    # set of tokens so this is only reached by pathological input.
+    PARSE_CACHE_LIMIT = 1024
     
     def __init__(self, terminal_interface):
         """Initialize with a terminal interface."""
         self.terminal = terminal_interface
+        # Parsed events for tokens outside the shared _TOKEN_TABLE, keyed
+        # by the raw key string
+        self._parse_cache: dict[str, KeyEvent] = {}
         
     def get_key_event(self, timeout: Optional[float] = None) -> Optional[KeyEvent]:
-        """Get next key event and map curtsies-style names to KeyEvent."""
+        """Get next key event and map curtsies-style names to KeyEvent.
+
+        Raw control characters and curtsies tokens share the single
+        parse_key path; there is no separate raw-sequence parser.
+        """
         key = self.terminal.get_key(timeout)
         if not key:
             return None
         return self.parse_key(key)
     
-    # No parse_raw_key: raw sequences are not supported; curtsies tokens only
-    
     def parse_key(self, key) -> KeyEvent:
-        """Parse a blessed key into a KeyEvent.
+        """Parse a key into a KeyEvent.
         
         Args:
-            key: blessed.keyboard.Keystroke object
+            key: Key string as returned by TerminalInterface.get_key (a
+                curtsies token name or a single character). Other objects
+                are converted with str().
             
         Returns:
             Parsed KeyEvent
         """
-        key_str = str(key)
-
-        # Fast-path: curtsies-style key names like '<LEFT>', '<Ctrl-x>', '<Alt-left>'
-        if key_str.startswith('<') and key_str.endswith('>'):
-            name = key_str[1:-1]
-            lower = name.lower()
-            # Support both '-' and '+' as modifier separators (e.g., '<Esc+u>')
-            lower = lower.replace('+', '-')
-            # Split modifiers and base
-            parts = lower.split('-') if '-' in lower else [lower]
-            mods = set()
-            base = parts[-1]
-            if len(parts) > 1:
-                mods = set(parts[:-1])
-            # Normalize meta->alt
-            if 'meta' in mods:
-                mods.add('alt')
-            # Treat 'esc' as alt modifier when combined with another key
-            if 'esc' in mods:
-                mods.add('alt')
-            # Normalize page keys first
-            if base in ('pageup', 'page_up'):
-                base = 'page_up'
-            elif base in ('pagedown', 'page_down'):
-                base = 'page_down'
-
-            specials = {
-                'left','right','up','down','home','end','enter','backspace','delete',
-                'page_up','page_down','insert'
-            }
-            # Map named whitespace tokens to regular characters
-            if base in ('space', 'spacebar', 'spc') and not mods:
-                return KeyEvent(key_type=KeyType.REGULAR, value=' ', raw=' ')
-            if base in ('tab',) and not mods:
-                return KeyEvent(key_type=KeyType.REGULAR, value='\t', raw='\t')
-            # Control modified letters
-            if 'ctrl' in mods and len(base) == 1:
-                # Map Ctrl-J / Ctrl-M to enter
-                if base in ('j','m'):
-                    return KeyEvent(key_type=KeyType.SPECIAL, value='enter', raw=key_str, is_sequence=True)
-                return KeyEvent(key_type=KeyType.CTRL, value=base, raw=key_str, is_ctrl=True)
-            # Alt/meta modified arrows or letters
-            if 'alt' in mods:
-                if base in specials or len(base) == 1:
-                    return KeyEvent(key_type=KeyType.ALT, value=base, raw=key_str, is_alt=True)
-            # Shift-modified arrows for selection
-            if 'shift' in mods and base in specials:
-                return KeyEvent(key_type=KeyType.SHIFT_SPECIAL, value=base, raw=key_str, is_shift=True, is_sequence=True)
-            # Plain specials
-            if base in specials:
-                return KeyEvent(key_type=KeyType.SPECIAL, value=base, raw=key_str, is_sequence=True)
-            # Escape
-            if base in ('esc','escape'):
-                return KeyEvent(key_type=KeyType.SPECIAL, value='escape', raw='\x1b')
-            # Fallback: treat unknown token as special
-            return KeyEvent(key_type=KeyType.SPECIAL, value=base, raw=key_str, is_sequence=True)
+        key_str = key if type(key) is str else str(key)
 
-        # Single-byte ASCII control chars (Ctrl-<letter>)
         if len(key_str) == 1:
             o = ord(key_str)
-            if 1 <= o <= 26:  # Ctrl-A .. Ctrl-Z (exclude ESC=27)
-                ch = chr(ord('a') + o - 1)
-                # Map Ctrl-J/Ctrl-M to enter, consistent with terminals
-                if ch in ('j', 'm'):
-                    return KeyEvent(key_type=KeyType.SPECIAL, value='enter', raw=key_str)
-                return KeyEvent(key_type=KeyType.CTRL, value=ch, raw=key_str, is_ctrl=True)
-            # Ctrl-^ (aka Ctrl-6) is ASCII 30 (RS). Treat as Ctrl-^.
-            if o == 30:
-                return KeyEvent(key_type=KeyType.CTRL, value='^', raw=key_str, is_ctrl=True)
+            if o < 256:
+                return _CHAR_EVENTS[o]
+            return _regular_char_event(key_str)
+
+        known = _TOKEN_TABLE.get(key_str)
+        if known is not None:
+            return known
+        cached = self._parse_cache.get(key_str)
+        if cached is not None:
+            return cached
+
+        event = _parse_key_str(key_str)
+        # Regular multi-character input is not cached: its space is
+        # unbounded and parsing it is already trivial.
+        if event.key_type != KeyType.REGULAR:
+            if len(self._parse_cache) >= self.PARSE_CACHE_LIMIT:
+                self._parse_cache.clear()
+            self._parse_cache[key_str] = event
+        return event
+
+
+# Named keys reported as SPECIAL (or SHIFT_SPECIAL/ALT when modified)
+_SPECIALS = frozenset({
+    'left', 'right', 'up', 'down', 'home', 'end', 'enter', 'backspace', 'delete',
+    'page_up', 'page_down', 'insert',
+})
+
+# Lowercases ASCII letters and maps the '+' separator to '-'
+_TOKEN_NORMALIZE = str.maketrans(
+    string.ascii_uppercase + '+', string.ascii_lowercase + '-'
+)
+
+# Token names that mean a literal space character
+_SPACE_NAMES = frozenset({'space', 'spacebar', 'spc'})
+
 
+def _parse_key_str(key_str: str) -> KeyEvent:
+    """Parse a key string into a new KeyEvent without consulting any cache."""
+    # Single characters are the common case (plain typing); handle them
+    # before probing for a bracketed token.
+    if len(key_str) == 1:
+        o = ord(key_str)
+        # Single-byte ASCII control chars (Ctrl-<letter>)
+        if 1 <= o <= 26:  # Ctrl-A .. Ctrl-Z (exclude ESC=27)
+            ch = chr(ord('a') + o - 1)
+            # Map Ctrl-J/Ctrl-M to enter, consistent with terminals
+            if ch in ('j', 'm'):
+                return KeyEvent(key_type=KeyType.SPECIAL, value='enter', raw=key_str)
+            return KeyEvent(key_type=KeyType.CTRL, value=ch, raw=key_str, is_ctrl=True)
+        # Ctrl-^ (aka Ctrl-6) is ASCII 30 (RS). Treat as Ctrl-^.
+        if o == 30:
+            return KeyEvent(key_type=KeyType.CTRL, value='^', raw=key_str, is_ctrl=True)
         # Bare ESC
-        if key_str == '\x1b':
+        if o == 27:
             return KeyEvent(key_type=KeyType.SPECIAL, value='escape', raw='\x1b')
-        
-        # Regular character
-        return KeyEvent(
-            key_type=KeyType.REGULAR,
-            value=key_str,
-            raw=key_str,
-            is_sequence=False
-        )
-    
-    # Legacy escape-sequence helpers removed; curtsies tokens are parsed directly above.
 
+    # Curtsies-style key names like '<LEFT>', '<Ctrl-x>', '<Alt-left>'
+    elif key_str and key_str[0] == '<' and key_str[-1] == '>':
+        name = key_str[1:-1]
+        if '-' in name or '+' in name:
+            # Support both '-' and '+' as modifier separators (e.g., '<Esc+u>');
+            # case-fold and normalize separators in a single pass for ASCII
+            if name.isascii():
+                lower = name.translate(_TOKEN_NORMALIZE)
+            else:
+                lower = name.lower().replace('+', '-')
+            # Split off the base in one pass; the modifier list is only ever
+            # a couple of items, so scan it directly rather than building a set
+            head, _, base = lower.rpartition('-')
+            mods = head.split('-') if '-' in head else (head,)
+            has_mods = True
+            ctrl = 'ctrl' in mods
+            # Meta, and Esc combined with another key, both mean Alt
+            alt = 'alt' in mods or 'meta' in mods or 'esc' in mods
+            shift = 'shift' in mods
+        else:
+            # Unmodified token such as '<LEFT>': no separator work needed
+            base = name.lower()
+            has_mods = ctrl = alt = shift = False
+        # Normalize page keys first
+        if base in ('pageup', 'page_up'):
+            base = 'page_up'
+        elif base in ('pagedown', 'page_down'):
+            base = 'page_down'
 
-def create_keyboard_handler(terminal_interface):
-    """Factory function to create a keyboard handler.
-    
-    Args:
-        terminal_interface: TerminalInterface instance
-        
-    Returns:
-        KeyboardHandler instance
+        # Map named whitespace tokens to regular characters
+        if base in _SPACE_NAMES and not has_mods:
+            return KeyEvent(key_type=KeyType.REGULAR, value=' ', raw=' ')
+        if base == 'tab' and not has_mods:
+            return KeyEvent(key_type=KeyType.REGULAR, value='\t', raw='\t')
+        # Control modified letters
+        if ctrl and len(base) == 1:
+            # Map Ctrl-J / Ctrl-M to enter
+            if base in ('j','m'):
+                return KeyEvent(key_type=KeyType.SPECIAL, value='enter', raw=key_str, is_sequence=True)
+            return KeyEvent(key_type=KeyType.CTRL, value=base, raw=key_str, is_ctrl=True)
+        # Alt/meta modified arrows or letters
+        if alt:
+            if base in _SPECIALS or len(base) == 1:
+                return KeyEvent(key_type=KeyType.ALT, value=base, raw=key_str, is_alt=True)
+        # Shift-modified arrows for selection
+        if shift and base in _SPECIALS:
+            return KeyEvent(key_type=KeyType.SHIFT_SPECIAL, value=base, raw=key_str, is_shift=True, is_sequence=True)
+        # Plain specials
+        if base in _SPECIALS:
+            return KeyEvent(key_type=KeyType.SPECIAL, value=base, raw=key_str, is_sequence=True)
+        # Escape
+        if base in ('esc','escape'):
+            return KeyEvent(key_type=KeyType.SPECIAL, value='escape', raw='\x1b')
+        # Fallback: treat unknown token as special
+        return KeyEvent(key_type=KeyType.SPECIAL, value=base, raw=key_str, is_sequence=True)
+
+    # Regular character
+    return KeyEvent(
+        key_type=KeyType.REGULAR,
+        value=key_str,
+        raw=key_str,
+        is_sequence=False
+    )
+
+
+def _curtsies_token_names():
+    """Yield the key tokens curtsies can emit in 'curtsies' keyname mode."""
+    named = (
+        'UP', 'DOWN', 'LEFT', 'RIGHT', 'HOME', 'END', 'PAGEUP', 'PAGEDOWN',
+        'INSERT', 'DELETE', 'BACKSPACE', 'TAB', 'SPACE', 'ESC',
+    ) + tuple(f'F{i}' for i in range(1, 13))
+    for prefix in ('', 'Ctrl-', 'Shift-', 'Meta-', 'Esc+', 'Esc+Shift-'):
+        for name in named:
+            yield f'<{prefix}{name}>'
+    for prefix in ('Esc+', 'Meta-'):
+        # 0x00-0x1A get Ctrl- labels below; ESC through 0x1F stay raw
+        for o in range(0x1b, 0x7f):
+            yield f'<{prefix}{chr(o)}>'
+        for o in range(0x00, 0x1b):
+            yield f'<{prefix}Ctrl-{chr(o + 0x40)}>'
+    for o in range(0x00, 0x1b):
+        yield f'<Ctrl-{chr(o + 0x60)}>'
+    for ch in '/6\\]':
+        yield f'<Ctrl-{ch}>'
+
+
+# Pre-parsed events for every token curtsies can emit, built once at import
+# so that the common keypress is a single dict lookup with no string work.
+_TOKEN_TABLE: dict[str, KeyEvent] = {
+    token: _parse_key_str(token) for token in _curtsies_token_names()
+}
+
+
+# Shared events for every single Latin-1 character, indexed by code point.
+# Covers plain typing (including accented letters) as well as Ctrl-letters,
+# Enter, ESC and Ctrl-^, so the dominant keypresses allocate nothing.
+_CHAR_EVENTS: tuple[KeyEvent, ...] = tuple(_parse_key_str(chr(o)) for o in range(256))
+
+
+@lru_cache(maxsize=512)
+def _regular_char_event(ch: str) -> KeyEvent:
+    """Return a shared event for a single character beyond the Latin-1 table.
+
+    Bounded so that a long run of distinct characters (e.g. CJK text) cannot
+    grow the memo without limit.
     """
-    return KeyboardHandler(terminal_interface)
+    return KeyEvent(key_type=KeyType.REGULAR, value=ch, raw=ch)
@@ -1,6 +1,9 @@
+import re
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import IntFlag
+from itertools import groupby
 from typing import Optional, List
 from .clipboard import ClipboardManager
 
@@ -8,6 +11,86 @@ from .clipboard import ClipboardManager
 StyleMask = List[int]
 StyleMasks = List[StyleMask]
 
+# Whitespace runs for the Emacs-style word commands. \s and \S agree with
+# str.isspace(), so these scan in C exactly as a character loop would.
+# Leading whitespace, then the word after it as group 1
+_SPACE_THEN_WORD_RE = re.compile(r'\s*(\S*)')
+_WORD_AND_SPACE_RE = re.compile(r'\S*\s*')
+# Greedy prefixes that back off to the last non-space / space character;
+# matched with an endpos so the text before the cursor is never copied
+_THROUGH_LAST_NONSPACE_RE = re.compile(r'.*\S', re.DOTALL)
+_THROUGH_LAST_SPACE_RE = re.compile(r'.*\s', re.DOTALL)
+
+
+def _word_start_before(para: str, pos: int) -> int:
+    """Return where the word before pos begins, skipping whitespace first."""
+    m = _THROUGH_LAST_NONSPACE_RE.match(para, 0, pos)
+    if m is None:
+        return 0
+    m = _THROUGH_LAST_SPACE_RE.match(para, 0, m.end())
+    return m.end() if m else 0
+
+
+def _is_word_char(ch: str) -> bool:
+    """True for the characters the regex class \\w matches."""
+    return ch.isalnum() or ch == '_'
+
+
+def _words_to_transpose(para: str, pos: int) -> Optional[tuple[int, int, int, int]]:
+    """Find the two words transpose_words swaps, scanning only near pos.
+
+    The first word is the one containing or touching pos, else the nearest
+    one before it, else the first one after it; the second is the word
+    following it. When the first word is the paragraph's last, the last two
+    words are used. Returns (start1, end1, start2, end2), or None when the
+    paragraph has fewer than two words.
+    """
+    n = len(para)
+    if (pos < n and _is_word_char(para[pos])) or (pos > 0 and _is_word_char(para[pos - 1])):
+        start1 = end1 = pos
+    else:
+        # Between words: back up to the end of the previous word
+        end1 = pos
+        while end1 > 0 and not _is_word_char(para[end1 - 1]):
+            end1 -= 1
+        if end1 == 0:
+            # No word before the cursor: take the first one after it
+            end1 = pos
+            while end1 < n and not _is_word_char(para[end1]):
+                end1 += 1
+            if end1 == n:
+                return None
+        start1 = end1
+    while start1 > 0 and _is_word_char(para[start1 - 1]):
+        start1 -= 1
+    while end1 < n and _is_word_char(para[end1]):
+        end1 += 1
+
+    start2 = end1
+    while start2 < n and not _is_word_char(para[start2]):
+        start2 += 1
+    if start2 < n:
+        end2 = start2
+        while end2 < n and _is_word_char(para[end2]):
+            end2 += 1
+        return (start1, end1, start2, end2)
+
+    # No word follows: swap the last word with the one before it
+    end0 = start1
+    while end0 > 0 and not _is_word_char(para[end0 - 1]):
+        end0 -= 1
+    if end0 == 0:
+        return None
+    start0 = end0
+    while start0 > 0 and _is_word_char(para[start0 - 1]):
+        start0 -= 1
+    return (start0, end0, start1, end1)
+
+
+# view.get_line_mapper, bound on first use; view imports this module at
+# load time, so it cannot be imported here at the top level.
+_get_line_mapper = None
+
 
 class StyleFlags(IntFlag):
     """Text style flags for bold and underline formatting.
@@ -20,19 +103,38 @@ class StyleFlags(IntFlag):
     BOLD_UNDERLINE = BOLD | UNDERLINE
 
 
-@dataclass
+# Plain-int flag values for code that tests flags per character or run;
+# bit operations on IntFlag members dispatch through Python-level methods
+STYLE_BOLD = int(StyleFlags.BOLD)
+STYLE_UNDER = int(StyleFlags.UNDERLINE)
+
+# Overstrike encoding of one character, indexed by its bold/underline
+# flags; None means the character is written unchanged
+_OVERSTRIKE_FORMATS = (
+    None,
+    '{0}\b{0}',       # STYLE_BOLD
+    '_\b{0}',         # STYLE_UNDER
+    '_\b{0}\b{0}',    # both
+)
+
+# One overstrike-encoded character; m.lastindex tells which form matched:
+# 1 '_\bX', 2 '_\bX\bX', 3 'X\bX', 4 plain X
+_OVERSTRIKE_TOKEN_RE = re.compile(r'_\x08(.)(\x08\1)?|(.)\x08\3|(.)', re.DOTALL)
+_OVERSTRIKE_TOKEN_STYLES = {
+    1: STYLE_UNDER,
+    2: STYLE_BOLD | STYLE_UNDER,
+    3: STYLE_BOLD,
+    4: 0,
+}
+
+
+@dataclass(order=True, slots=True)
 class CursorPosition:
+    # Field order gives document order: comparisons are generated as
+    # tuple comparisons of (paragraph_index, character_index)
     paragraph_index: int = 0
     character_index: int = 0
 
-    def __lt__(self, other):
-        if self.paragraph_index != other.paragraph_index:
-            return self.paragraph_index < other.paragraph_index
-        return self.character_index < other.character_index
-
-    def __ge__(self, other):
-        return not self < other
-
 
 class TextView(ABC):
     _model: "Optional[TextModel]" = None
@@ -66,12 +168,21 @@ class TextModel:
     
     Internally, styles are stored as parallel arrays of bit flags alongside the text.
     """
+    __slots__ = (
+        'view', 'paragraphs', 'cursor_position', 'selection_start', 'selection_end',
+        'styles', 'caret_style', '_word_counts', '_render_suspended', '_render_pending',
+    )
+
     paragraphs: List[str]
     cursor_position: CursorPosition
     view: TextView
     styles: StyleMasks
     caret_style: int
 
+    # Keep for backward compatibility
+    STYLE_BOLD = STYLE_BOLD
+    STYLE_UNDER = STYLE_UNDER
+
     def __init__(self, view: TextView, paragraphs: Optional[List[str]] = None):
         self.view = view
         self.view._model = self
@@ -80,11 +191,37 @@ class TextModel:
         self.selection_start: Optional[CursorPosition] = None  # CursorPosition when selection started
         self.selection_end: Optional[CursorPosition] = None    # Current end of selection
         # Styling: per-paragraph parallel mask arrays with bit flags
-        self.STYLE_BOLD = StyleFlags.BOLD  # Keep for backward compatibility
-        self.STYLE_UNDER = StyleFlags.UNDERLINE  # Keep for backward compatibility
         self.styles = [[0]*len(p) for p in self.paragraphs]
         # Caret style used when inserting text; updated on cursor moves
         self.caret_style = 0
+        # Word counts keyed by paragraph text, filled in by count_words
+        self._word_counts: dict[str, int] = {}
+        # Nesting depth of batch(), and whether a render was deferred by it
+        self._render_suspended = 0
+        self._render_pending = False
+
+    @contextmanager
+    def batch(self):
+        """Defer rendering so a compound edit redraws the view only once.
+
+        Model operations inside the block that would render instead mark a
+        render as pending; the outermost block renders once on exit.
+        """
+        self._render_suspended += 1
+        try:
+            yield self
+        finally:
+            self._render_suspended -= 1
+            if not self._render_suspended and self._render_pending:
+                self._render_pending = False
+                self.view.render()
+
+    def _request_render(self) -> None:
+        """Render the view now, or once the enclosing batch() exits."""
+        if self._render_suspended:
+            self._render_pending = True
+        else:
+            self.view.render()
 
     def _sync_styles_length(self):
         """Ensure styles list mirrors paragraphs lengths (internal safety).
@@ -94,21 +231,33 @@ class TextModel:
         # Fast path: check if sync is needed at all
         if len(self.styles) == len(self.paragraphs):
             # Only check and fix individual paragraph lengths that differ
-            for i, para in enumerate(self.paragraphs):
-                para_len = len(para)
-                style_len = len(self.styles[i])
-                if style_len != para_len:
-                    # Resize only this specific style array
-                    if style_len < para_len:
-                        # Extend with zeros
-                        self.styles[i].extend([0] * (para_len - style_len))
-                    else:
-                        # Truncate
-                        self.styles[i] = self.styles[i][:para_len]
+            self._sync_style_rows(0, len(self.paragraphs) - 1)
         else:
             # Full rebuild required - paragraph count changed
             self.styles = [[0]*len(p) for p in self.paragraphs]
 
+    def _sync_style_rows(self, first: int, last: Optional[int] = None):
+        """Like _sync_styles_length, but only fix rows first..last (inclusive).
+
+        Edits read only the rows they touch, so they check just those rather
+        than every paragraph in the document. A paragraph count mismatch
+        still rebuilds everything.
+        """
+        if len(self.styles) != len(self.paragraphs):
+            self._sync_styles_length()
+            return
+        for i in range(first, (first if last is None else last) + 1):
+            para_len = len(self.paragraphs[i])
+            style_len = len(self.styles[i])
+            if style_len != para_len:
+                # Resize only this specific style array
+                if style_len < para_len:
+                    # Extend with zeros
+                    self.styles[i].extend([0] * (para_len - style_len))
+                else:
+                    # Truncate
+                    self.styles[i] = self.styles[i][:para_len]
+
     def _update_caret_style_from_position(self):
         """Update caret_style based on style at cursor position (inherit from left)."""
         pi = self.cursor_position.paragraph_index
@@ -134,53 +283,39 @@ class TextModel:
         - both: '_' + '\b' + c + '\b' + c
         """
         lines = []
+        styled = STYLE_BOLD | STYLE_UNDER
         for pi, para in enumerate(self.paragraphs):
-            style_mask = self.styles[pi] if pi < len(self.styles) else [0]*len(para)
+            style_mask = self.styles[pi] if pi < len(self.styles) else None
+            if not style_mask or not any(style_mask):
+                # Unstyled paragraphs, the usual case, are written as is
+                lines.append(para)
+                continue
+            # Encode whole runs of equally styled characters at a time
             out = []
-            for i, ch in enumerate(para):
-                flags = style_mask[i] if i < len(style_mask) else 0
-                seg = ''
-                if flags & self.STYLE_UNDER:
-                    seg += '_' + '\b' + ch
-                else:
-                    seg += ch
-                if flags & self.STYLE_BOLD:
-                    seg += '\b' + ch
-                out.append(seg)
+            start = 0
+            for flags, run in groupby(style_mask[:len(para)]):
+                end = start + len(list(run))
+                fmt = _OVERSTRIKE_FORMATS[int(flags) & styled]
+                chunk = para[start:end]
+                out.append(chunk if fmt is None else ''.join(map(fmt.format, chunk)))
+                start = end
+            # Characters beyond the mask are unstyled
+            out.append(para[start:])
             lines.append(''.join(out))
         return '\n'.join(lines)
 
     @staticmethod
     def _parse_overstrike_paragraph(text: str) -> tuple[str, StyleMask]:
         """Parse a single paragraph with overstrike into plain text + styles mask."""
-        i = 0
+        if '\b' not in text:
+            # No overstrike at all: every character is plain
+            return (text, [0] * len(text))
         out_chars: List[str] = []
         out_styles: StyleMask = []
-        while i < len(text):
-            ch = text[i]
-            # Underline pattern: '_' '\b' X
-            if ch == '_' and i+2 < len(text) and text[i+1] == '\b':
-                real = text[i+2]
-                out_chars.append(real)
-                # Check for a following '\b' + same char (bold on top)
-                style = StyleFlags.UNDERLINE
-                if i+4 < len(text) and text[i+3] == '\b' and text[i+4] == real:
-                    style |= StyleFlags.BOLD
-                    i += 5
-                else:
-                    i += 3
-                out_styles.append(int(style))
-                continue
-            # Bold pattern: X '\b' X
-            if i+2 < len(text) and text[i+1] == '\b' and text[i+2] == ch:
-                out_chars.append(ch)
-                out_styles.append(int(StyleFlags.BOLD))
-                i += 3
-                continue
-            # Plain char
-            out_chars.append(ch)
-            out_styles.append(0)
-            i += 1
+        for m in _OVERSTRIKE_TOKEN_RE.finditer(text):
+            kind = m.lastindex
+            out_chars.append(m.group(1 if kind == 2 else kind))
+            out_styles.append(_OVERSTRIKE_TOKEN_STYLES[kind])
         return (''.join(out_chars), out_styles)
 
     @classmethod
@@ -198,67 +333,92 @@ class TextModel:
         return m
 
     def insert_text(self, text: str, position: Optional[CursorPosition] = None):
+        if not text:
+            # Nothing to insert; in particular, do not redraw
+            return
+        cp = self.cursor_position
+        view = self.view
         if position is None:
-            position = self.cursor_position
+            position = cp
 
-        before_view = position.paragraph_index < self.view.start_paragraph_index
-        in_view = self.view.start_paragraph_index <= position.paragraph_index < self.view.end_paragraph_index
+        view_start = view.start_paragraph_index
+        before_view = position.paragraph_index < view_start
+        in_view = view_start <= position.paragraph_index < view.end_paragraph_index
+
+        para_idx = cp.paragraph_index
+        char_idx = cp.character_index
+
+        if "\n" not in text:
+            # Typing within one paragraph: update it in place rather than
+            # rebuilding the paragraph and style lists
+            para = self.paragraphs[para_idx]
+            if len(self.styles) != len(self.paragraphs) or len(self.styles[para_idx]) != len(para):
+                self._sync_style_rows(para_idx)
+            if char_idx >= len(para):
+                # Appending, the usual typing position: one copy, no slicing
+                self.paragraphs[para_idx] = para + text
+            else:
+                # Build the result in one allocation instead of chaining
+                # concatenations through an intermediate string
+                self.paragraphs[para_idx] = ''.join((para[:char_idx], text, para[char_idx:]))
+            if len(text) == 1:
+                # A single keystroke
+                self.styles[para_idx].insert(char_idx, self.caret_style)
+            else:
+                self.styles[para_idx][char_idx:char_idx] = [self.caret_style] * len(text)
+            cp.character_index = char_idx + len(text)
+            if in_view:
+                self._request_render()
+            return
 
         paragraphs = text.split("\n")
-        para_idx = self.cursor_position.paragraph_index
-        char_idx = self.cursor_position.character_index
         current_paragraph = self.paragraphs[para_idx]
         before_cursor = current_paragraph[:char_idx]
         after_cursor = current_paragraph[char_idx:]
 
         # Prepare styles for insertion
-        self._sync_styles_length()
+        self._sync_style_rows(para_idx)
+        caret = self.caret_style
         curr_styles = self.styles[para_idx]
-        before_styles = curr_styles[:char_idx]
         after_styles = curr_styles[char_idx:]
-        insert_styles_segments = [ [self.caret_style]*len(seg) for seg in paragraphs ]
-
-        # Merge text
+        # The current mask becomes the first row: cut it at the cursor and
+        # extend it in place rather than copying the part before the cursor
+        del curr_styles[char_idx:]
+        curr_styles.extend([caret] * len(paragraphs[0]))
+        insert_styles_segments = [curr_styles]
+        insert_styles_segments.extend([caret] * len(seg) for seg in paragraphs[1:])
+        insert_styles_segments[-1].extend(after_styles)
+
+        # Merge text; each merged paragraph is built with one concatenation
+        new_char_idx = len(paragraphs[-1])
         paragraphs[0] = before_cursor + paragraphs[0]
-        paragraphs[-1] += after_cursor
-        new_paras = (
-            self.paragraphs[: para_idx]
-            + paragraphs
-            + self.paragraphs[para_idx + 1 :]
-        )
-        # Merge styles
-        insert_styles_segments[0] = before_styles + insert_styles_segments[0]
-        insert_styles_segments[-1] = insert_styles_segments[-1] + after_styles
-        new_styles = (
-            self.styles[: para_idx]
-            + insert_styles_segments
-            + self.styles[para_idx + 1 :]
-        )
-        self.paragraphs = new_paras
-        self.styles = new_styles
-        self.cursor_position.paragraph_index = para_idx + len(paragraphs) - 1
-        self.cursor_position.character_index = len(paragraphs[-1]) - len(after_cursor)
+        paragraphs[-1] = paragraphs[-1] + after_cursor
+        # Splice in place; only the tail after para_idx is shifted
+        self.paragraphs[para_idx:para_idx + 1] = paragraphs
+        self.styles[para_idx:para_idx + 1] = insert_styles_segments
+        cp.paragraph_index = para_idx + len(paragraphs) - 1
+        cp.character_index = new_char_idx
         # After inserting newline, styles persist across newlines by design (caret_style unchanged)
 
         if before_view:
-            self.view.start_paragraph_index += len(paragraphs) - 1
-            self.view.end_paragraph_index += len(paragraphs) - 1
+            view.start_paragraph_index += len(paragraphs) - 1
+            view.end_paragraph_index += len(paragraphs) - 1
         elif in_view:
-            self.view.render()
+            self._request_render()
 
     def backspace(self) -> None:
         """Delete character before cursor, maintaining styles."""
-        para_idx = self.cursor_position.paragraph_index
-        char_idx = self.cursor_position.character_index
+        cp = self.cursor_position
+        para_idx = cp.paragraph_index
+        char_idx = cp.character_index
         if char_idx > 0:
             para = self.paragraphs[para_idx]
             self.paragraphs[para_idx] = para[:char_idx-1] + para[char_idx:]
-            style_mask = self.styles[para_idx]
-            self.styles[para_idx] = style_mask[:char_idx-1] + style_mask[char_idx:]
-            self.cursor_position.character_index -= 1
+            del self.styles[para_idx][char_idx-1:char_idx]
+            cp.character_index = char_idx - 1
         elif para_idx > 0:
             self._join_with_previous_paragraph()
-        self.view.render()
+        self._request_render()
 
     def _insert_text_with_styles(self, parts: list[str], parts_styles: list[list[int]]):
         before_view = self.cursor_position.paragraph_index < self.view.start_paragraph_index
@@ -268,51 +428,71 @@ class TextModel:
         current_paragraph = self.paragraphs[para_idx]
         before_cursor = current_paragraph[:char_idx]
         after_cursor = current_paragraph[char_idx:]
-        self._sync_styles_length()
+        self._sync_style_rows(para_idx)
         curr_styles = self.styles[para_idx]
-        before_styles = curr_styles[:char_idx]
         after_styles = curr_styles[char_idx:]
         # Merge
         parts = parts[:]
-        parts_styles = parts_styles[:]
+        # The current mask becomes the first row, cut at the cursor and
+        # extended in place. Every other row is copied: the caller (e.g. the
+        # clipboard) keeps its own, and the model edits its rows in place
+        del curr_styles[char_idx:]
+        curr_styles.extend(parts_styles[0])
+        rows = [curr_styles]
+        rows.extend(list(row) for row in parts_styles[1:])
         parts[0] = before_cursor + parts[0]
-        parts_styles[0] = before_styles + parts_styles[0]
         parts[-1] = parts[-1] + after_cursor
-        parts_styles[-1] = parts_styles[-1] + after_styles
-        self.paragraphs = self.paragraphs[:para_idx] + parts + self.paragraphs[para_idx+1:]
-        self.styles = self.styles[:para_idx] + parts_styles + self.styles[para_idx+1:]
+        rows[-1].extend(after_styles)
+        self.paragraphs[para_idx:para_idx+1] = parts
+        self.styles[para_idx:para_idx+1] = rows
         self.cursor_position.paragraph_index = para_idx + len(parts) - 1
         self.cursor_position.character_index = len(parts[-1]) - len(after_cursor)
         if before_view:
             self.view.start_paragraph_index += len(parts) - 1
             self.view.end_paragraph_index += len(parts) - 1
         elif in_view:
-            self.view.render()
+            self._request_render()
+
+    def _render_if_moved(self, old: tuple[int, int]) -> None:
+        """Redraw unless the cursor is still at old (paragraph, char).
+
+        Motions that hit the document edge or are already in place leave
+        the view unchanged, so the repaint can be skipped.
+        """
+        cp = self.cursor_position
+        if (cp.paragraph_index, cp.character_index) != old:
+            self._request_render()
 
     def right_char(self):
-        if self.cursor_position.character_index < len(self.paragraphs[self.cursor_position.paragraph_index]):
-            self.cursor_position.character_index += 1
-        elif self.cursor_position.paragraph_index + 1 < len(self.paragraphs):
-            self.cursor_position.paragraph_index += 1
-            self.cursor_position.character_index = 0
+        cp = self.cursor_position
+        para_idx = cp.paragraph_index
+        char_idx = cp.character_index
+        if char_idx < len(self.paragraphs[para_idx]):
+            cp.character_index = char_idx + 1
+        elif para_idx + 1 < len(self.paragraphs):
+            cp.paragraph_index = para_idx + 1
+            cp.character_index = 0
         self._update_caret_style_from_position()
-        self.view.render()
+        self._render_if_moved((para_idx, char_idx))
 
     def left_char(self):
-        if self.cursor_position.character_index > 0:
-            self.cursor_position.character_index -= 1
-        elif self.cursor_position.paragraph_index > 0:
-            self.cursor_position.paragraph_index -= 1
-            self.cursor_position.character_index = len(self.paragraphs[self.cursor_position.paragraph_index])
+        cp = self.cursor_position
+        para_idx = cp.paragraph_index
+        char_idx = cp.character_index
+        if char_idx > 0:
+            cp.character_index = char_idx - 1
+        elif para_idx > 0:
+            cp.paragraph_index = para_idx - 1
+            cp.character_index = len(self.paragraphs[para_idx - 1])
         self._update_caret_style_from_position()
-        self.view.render()
+        self._render_if_moved((para_idx, char_idx))
 
     def move_beginning_of_document(self) -> None:
         """Move cursor to the beginning of the document (Home)."""
         self.cursor_position.paragraph_index = 0
         self.cursor_position.character_index = 0
         self._update_caret_style_from_position()
-        self.view.render()
+        self._request_render()
 
     def move_end_of_document(self) -> None:
         """Move cursor to the end of the document (End)."""
@@ -324,7 +504,7 @@ class TextModel:
             self.cursor_position.paragraph_index = 0
             self.cursor_position.character_index = 0
         self._update_caret_style_from_position()
-        self.view.render()
+        self._request_render()
 
     def backward_paragraph(self) -> None:
         """Move to beginning of previous non-empty paragraph (M-up).
@@ -363,7 +543,7 @@ class TextModel:
             # else: nothing before; no movement
 
         self._update_caret_style_from_position()
-        self.view.render()
+        self._request_render()
 
     def forward_paragraph(self) -> None:
         """Move to beginning of paragraph after the next non-empty (M-down).
@@ -390,7 +570,7 @@ class TextModel:
             # else: no subsequent non-empty paragraph; no movement
 
         self._update_caret_style_from_position()
-        self.view.render()
+        self._request_render()
     
     def count_words(self) -> int:
         """Count the total number of words in the document.
@@ -398,12 +578,19 @@ class TextModel:
         Returns:
             Total word count
         """
-        word_count = 0
+        # Per-paragraph counts are remembered by text, so only paragraphs
+        # edited since the last count are split again
+        counts = self._word_counts
+        total = 0
         for paragraph in self.paragraphs:
-            # Split by whitespace and count non-empty strings
-            words = paragraph.split()
-            word_count += len(words)
-        return word_count
+            n = counts.get(paragraph)
+            if n is None:
+                n = counts[paragraph] = len(paragraph.split())
+            total += n
+        # Drop counts for text that no longer appears in the document
+        if len(counts) > 2 * len(self.paragraphs) + 64:
+            self._word_counts = {p: counts[p] for p in self.paragraphs}
+        return total
     
     def transpose_words(self):
         """Transpose word before cursor with word after cursor.
@@ -414,66 +601,34 @@ class TextModel:
         paragraph = self.paragraphs[para_idx]
         char_idx = self.cursor_position.character_index
         
-        # Find word boundaries
-        import re
-        words = list(re.finditer(r'\b\w+\b', paragraph))
-        
-        if len(words) < 2:
+        # Find the two words around the cursor
+        found = _words_to_transpose(paragraph, char_idx)
+        if found is None:
             return
-        
-        # Find which words to transpose
-        current_word_idx = None
-        for i, match in enumerate(words):
-            if match.start() <= char_idx <= match.end():
-                current_word_idx = i
-                break
-            elif char_idx < match.start():
-                current_word_idx = i - 1 if i > 0 else 0
-                break
-        
-        if current_word_idx is None:
-            # Cursor is after all words
-            if len(words) >= 2:
-                current_word_idx = len(words) - 2
-            else:
-                return
-        
-        # Ensure we have two words to transpose
-        if current_word_idx < 0 or current_word_idx >= len(words) - 1:
-            if len(words) >= 2:
-                # At end, transpose last two words
-                current_word_idx = len(words) - 2
-            else:
-                return
-        
-        # Get the two words to transpose
-        word1 = words[current_word_idx]
-        word2 = words[current_word_idx + 1]
+        start1, end1, start2, end2 = found
         
         # Build the new paragraph
         new_paragraph = (
-            paragraph[:word1.start()] +
-            word2.group() +
-            paragraph[word1.end():word2.start()] +
-            word1.group() +
-            paragraph[word2.end():]
+            paragraph[:start1] +
+            paragraph[start2:end2] +
+            paragraph[end1:start2] +
+            paragraph[start1:end1] +
+            paragraph[end2:]
         )
         
         # Update paragraph and styles (styles remain with their characters)
-        old_styles = self.styles[para_idx]
-        new_styles = (
-            old_styles[:word1.start()] +
-            old_styles[word2.start():word2.end()] +
-            old_styles[word1.end():word2.start()] +
-            old_styles[word1.start():word1.end()] +
-            old_styles[word2.end():]
+        # Only the span from word1 through word2 is rewritten, in place
+        style_mask = self.styles[para_idx]
+        style_mask[start1:end2] = (
+            style_mask[start2:end2] +
+            style_mask[end1:start2] +
+            style_mask[start1:end1]
         )
         self.paragraphs[para_idx] = new_paragraph
-        self.styles[para_idx] = new_styles
         
         # Move cursor to end of transposed region
-        self.cursor_position.character_index = word2.start() + len(word1.group())
-        self.view.render()
+        self.cursor_position.character_index = start2 + (end1 - start1)
+        self._request_render()
     
     def transpose_chars(self):
         """Transpose character before cursor with character after cursor.
@@ -494,13 +649,13 @@ class TextModel:
             # At beginning, transpose first two chars
             self.paragraphs[para_idx] = paragraph[1] + paragraph[0] + paragraph[2:]
             style_mask = self.styles[para_idx]
-            self.styles[para_idx] = style_mask[1:2] + style_mask[0:1] + style_mask[2:]
+            style_mask[0:2] = style_mask[1:2] + style_mask[0:1]
             self.cursor_position.character_index = 2
         elif char_idx >= para_len:
             # At end, transpose last two chars
             self.paragraphs[para_idx] = paragraph[:-2] + paragraph[-1] + paragraph[-2]
             style_mask = self.styles[para_idx]
-            self.styles[para_idx] = style_mask[:-2] + style_mask[-1:] + style_mask[-2:-1]
+            style_mask[-2:] = style_mask[-1:] + style_mask[-2:-1]
             # Cursor stays at end
         else:
             # In middle, transpose char before and after cursor
@@ -508,7 +663,7 @@ class TextModel:
                 # Special case when cursor is at position 1
                 self.paragraphs[para_idx] = paragraph[1] + paragraph[0] + paragraph[2:]
                 style_mask = self.styles[para_idx]
-                self.styles[para_idx] = style_mask[1:2] + style_mask[0:1] + style_mask[2:]
+                style_mask[0:2] = style_mask[1:2] + style_mask[0:1]
             else:
                 self.paragraphs[para_idx] = (
                     paragraph[:char_idx-1] + 
@@ -517,15 +672,12 @@ class TextModel:
                     paragraph[char_idx+1:]
                 )
                 style_mask = self.styles[para_idx]
-                self.styles[para_idx] = (
-                    style_mask[:char_idx-1] +
-                    style_mask[char_idx:char_idx+1] +
-                    style_mask[char_idx-1:char_idx] +
-                    style_mask[char_idx+1:]
+                style_mask[char_idx-1:char_idx+1] = (
+                    style_mask[char_idx:char_idx+1] + style_mask[char_idx-1:char_idx]
                 )
             self.cursor_position.character_index = min(char_idx + 1, para_len)
         
-        self.view.render()
+        self._request_render()
     
     def center_line(self) -> bool:
         """Center the current paragraph if it fits on one line.
@@ -538,14 +690,18 @@ class TextModel:
         para_idx = self.cursor_position.paragraph_index
         paragraph = self.paragraphs[para_idx]
 
-        # Strip existing leading/trailing spaces to get true content
-        stripped = paragraph.strip()
+        # Strip existing leading/trailing spaces to get true content; keep
+        # the leading width for the cursor adjustment below
+        lstripped = paragraph.lstrip()
+        old_leading = len(paragraph) - len(lstripped)
+        stripped = lstripped.rstrip()
 
         # Don't center empty lines
         if not stripped:
             self.paragraphs[para_idx] = ""
+            del self.styles[para_idx][:]
             self.cursor_position.character_index = 0
-            self.view.render()
+            self._request_render()
             return True
 
         # Check if paragraph would wrap (multi-line) or is at max width
@@ -556,19 +712,26 @@ class TextModel:
         spaces_needed = (width - len(stripped)) // 2
         centered = ' ' * spaces_needed + stripped
         
-        # Update the paragraph
+        # Update the paragraph; its styles keep following the text, with
+        # the padding unstyled. The row is repaired against the old text
+        # before being cut, so the offsets below still line up with it.
+        self._sync_style_rows(para_idx)
+        row = self.styles[para_idx]
+        del row[old_leading + len(stripped):]
+        row[:old_leading] = [0] * spaces_needed
         self.paragraphs[para_idx] = centered
         
         # Adjust cursor position to account for added spaces
         # If cursor was at the beginning, keep it at the beginning of the centered text
-        if self.cursor_position.character_index <= len(paragraph) - len(paragraph.lstrip()):
-            self.cursor_position.character_index = spaces_needed
+        cp = self.cursor_position
+        if cp.character_index <= old_leading:
+            cp.character_index = spaces_needed
         else:
-            # Adjust cursor position by the difference in leading spaces
-            old_leading = len(paragraph) - len(paragraph.lstrip())
-            self.cursor_position.character_index = self.cursor_position.character_index - old_leading + spaces_needed
+            # Adjust cursor position by the difference in leading spaces,
+            # staying within the text if it was among the trailing spaces
+            cp.character_index = min(cp.character_index - old_leading + spaces_needed, len(centered))
         
-        self.view.render()
+        self._request_render()
         return True
 
  
@@ -579,25 +742,18 @@ class TextModel:
         Returns:
             True if join was performed, False if at document start
         """
-        if self.cursor_position.paragraph_index == 0:
+        cp = self.cursor_position
+        para_idx = cp.paragraph_index
+        if para_idx == 0:
             return False
             
-        prev_idx = self.cursor_position.paragraph_index - 1
-        prev_para = self.paragraphs[prev_idx]
-        curr_para = self.paragraphs[self.cursor_position.paragraph_index]
-        
-        # Combine paragraphs
-        self.paragraphs[prev_idx] = prev_para + curr_para
-        del self.paragraphs[self.cursor_position.paragraph_index]
-        # Combine styles
-        prev_styles = self.styles[prev_idx]
-        curr_styles = self.styles[self.cursor_position.paragraph_index]
-        self.styles[prev_idx] = prev_styles + curr_styles
-        del self.styles[self.cursor_position.paragraph_index]
+        prev_idx = para_idx - 1
+        join_point = len(self.paragraphs[prev_idx])
+        self._merge_with_next_paragraph(prev_idx)
         
         # Move cursor to join point
-        self.cursor_position.paragraph_index = prev_idx
-        self.cursor_position.character_index = len(prev_para)
+        cp.paragraph_index = prev_idx
+        cp.character_index = join_point
         
         return True
     
@@ -607,85 +763,68 @@ class TextModel:
         Returns:
             True if join was performed, False if at document end
         """
-        if self.cursor_position.paragraph_index + 1 >= len(self.paragraphs):
+        para_idx = self.cursor_position.paragraph_index
+        if para_idx + 1 >= len(self.paragraphs):
             return False
             
-        para_idx = self.cursor_position.paragraph_index
-        curr_para = self.paragraphs[para_idx]
-        next_para = self.paragraphs[para_idx + 1]
-        
-        # Combine paragraphs
-        self.paragraphs[para_idx] = curr_para + next_para
-        del self.paragraphs[para_idx + 1]
-        # Combine styles
-        self.styles[para_idx] = self.styles[para_idx] + self.styles[para_idx + 1]
-        del self.styles[para_idx + 1]
-        
+        self._merge_with_next_paragraph(para_idx)
         return True
+
+    def _merge_with_next_paragraph(self, para_idx: int):
+        """Append paragraph para_idx + 1, and its styles, to paragraph para_idx.
+
+        Each list is spliced once, so the tail shifts down a single time.
+        """
+        paragraphs = self.paragraphs
+        paragraphs[para_idx:para_idx + 2] = [paragraphs[para_idx] + paragraphs[para_idx + 1]]
+        row = self.styles[para_idx]
+        row.extend(self.styles[para_idx + 1])
+        self.styles[para_idx:para_idx + 2] = [row]
     
     def right_word(self):
         """Move cursor forward by one word (Emacs-style)."""
-        para = self.paragraphs[self.cursor_position.paragraph_index]
-        start = self.cursor_position.character_index
-        pos = start
+        cp = self.cursor_position
+        para_idx = cp.paragraph_index
+        start = cp.character_index
+        old = (para_idx, start)
+        para = self.paragraphs[para_idx]
         para_len = len(para)
-        # Are we at the start of a word?
-        at_word_start = (
-            start < para_len
-            and not para[start].isspace()
-            and (start == 0 or para[start - 1].isspace())
-        )
         
-        # Skip current word characters
-        while pos < para_len and not para[pos].isspace():
-            pos += 1
-        
-        # Skip whitespace
-        while pos < para_len and para[pos].isspace():
-            pos += 1
+        # Skip current word characters, then whitespace
+        pos = _WORD_AND_SPACE_RE.match(para, start).end()
         
         if pos < para_len:
             # Found next word in same paragraph
-            self.cursor_position.character_index = pos
+            cp.character_index = pos
+        elif start >= para_len and para_idx + 1 < len(self.paragraphs):
+            # Started at end of paragraph: move to next paragraph start
+            cp.paragraph_index = para_idx + 1
+            cp.character_index = 0
         else:
-            # Reached end of paragraph while scanning
-            if start >= para_len and self.cursor_position.paragraph_index + 1 < len(self.paragraphs):
-                # Started at end of paragraph: move to next paragraph start
-                self.cursor_position.paragraph_index += 1
-                self.cursor_position.character_index = 0
-            else:
-                # Otherwise stop at end of current paragraph (including when starting
-                # at the first letter of the last word)
-                self.cursor_position.character_index = para_len
+            # Otherwise stop at end of current paragraph (including when starting
+            # at the first letter of the last word)
+            cp.character_index = para_len
         
         self._update_caret_style_from_position()
-        self.view.render()
+        self._render_if_moved(old)
     
     def left_word(self):
         """Move cursor backward by one word (Emacs-style)."""
-        para = self.paragraphs[self.cursor_position.paragraph_index]
-        pos = self.cursor_position.character_index
+        cp = self.cursor_position
+        para_idx = cp.paragraph_index
+        pos = cp.character_index
+        old = (para_idx, pos)
         
         if pos > 0:
-            # Move back one position to start
-            pos -= 1
-            
-            # Skip whitespace backwards
-            while pos > 0 and para[pos].isspace():
-                pos -= 1
-            
-            # Skip word characters backwards
-            while pos > 0 and not para[pos - 1].isspace():
-                pos -= 1
-            
-            self.cursor_position.character_index = pos
-        elif self.cursor_position.paragraph_index > 0:
+            # Skip whitespace backwards, then word characters
+            cp.character_index = _word_start_before(self.paragraphs[para_idx], pos)
+        elif para_idx > 0:
             # Move to end of previous paragraph
-            self.cursor_position.paragraph_index -= 1
-            self.cursor_position.character_index = len(self.paragraphs[self.cursor_position.paragraph_index])
+            cp.paragraph_index = para_idx - 1
+            cp.character_index = len(self.paragraphs[para_idx - 1])
         
         self._update_caret_style_from_position()
-        self.view.render()
+        self._render_if_moved(old)
     
     def downcase_word(self):
         """Convert from cursor to end of word to lowercase (Emacs M-l).
@@ -693,35 +832,7 @@ class TextModel:
         If in middle of word, convert from cursor to end of word.
         If in whitespace, skip to next word and convert it.
         """
-        para = self.paragraphs[self.cursor_position.paragraph_index]
-        start_pos = self.cursor_position.character_index
-        pos = start_pos
-        para_len = len(para)
-        
-        if pos >= para_len:
-            return
-        
-        # If we're in whitespace, skip to next word
-        if pos < para_len and para[pos].isspace():
-            while pos < para_len and para[pos].isspace():
-                pos += 1
-            start_pos = pos
-        
-        if pos >= para_len:
-            return
-        
-        # Find end of current word
-        while pos < para_len and not para[pos].isspace():
-            pos += 1
-        
-        # Convert to lowercase from start_pos to end of word
-        if pos > start_pos:
-            self.paragraphs[self.cursor_position.paragraph_index] = (
-                para[:start_pos] + para[start_pos:pos].lower() + para[pos:]
-            )
-            self.cursor_position.character_index = pos
-        
-        self.view.render()
+        self._convert_word_case(str.lower)
     
     def upcase_word(self):
         """Convert from cursor to end of word to uppercase (Emacs M-u).
@@ -729,35 +840,34 @@ class TextModel:
         If in middle of word, convert from cursor to end of word.
         If in whitespace, skip to next word and convert it.
         """
-        para = self.paragraphs[self.cursor_position.paragraph_index]
-        start_pos = self.cursor_position.character_index
-        pos = start_pos
+        self._convert_word_case(str.upper)
+    
+    def _convert_word_case(self, convert):
+        """Apply convert to the text from cursor to end of word (or next word)."""
+        cp = self.cursor_position
+        para_idx = cp.paragraph_index
+        para = self.paragraphs[para_idx]
         para_len = len(para)
         
-        if pos >= para_len:
+        if cp.character_index >= para_len:
             return
         
-        # If we're in whitespace, skip to next word
-        if pos < para_len and para[pos].isspace():
-            while pos < para_len and para[pos].isspace():
-                pos += 1
-            start_pos = pos
+        # If we're in whitespace, skip to next word; one match finds both
+        # the word's start and its end
+        start_pos, pos = _SPACE_THEN_WORD_RE.match(para, cp.character_index).span(1)
         
-        if pos >= para_len:
+        if start_pos >= para_len:
             return
         
-        # Find end of current word
-        while pos < para_len and not para[pos].isspace():
-            pos += 1
-        
-        # Convert to uppercase from start_pos to end of word
         if pos > start_pos:
-            self.paragraphs[self.cursor_position.paragraph_index] = (
-                para[:start_pos] + para[start_pos:pos].upper() + para[pos:]
-            )
-            self.cursor_position.character_index = pos
-        
-        self.view.render()
+            word = para[start_pos:pos]
+            converted = convert(word)
+            # A word already in the target case leaves the paragraph as is
+            if converted != word:
+                self.paragraphs[para_idx] = para[:start_pos] + converted + para[pos:]
+            cp.character_index = pos
+        
+        self._request_render()
     
     def capitalize_word(self):
         """Capitalize the word at or after cursor position (Emacs M-c).
@@ -769,19 +879,12 @@ class TextModel:
         pos = self.cursor_position.character_index
         para_len = len(para)
         
-        # Skip to start of word if not at one
-        while pos < para_len and para[pos].isspace():
-            pos += 1
+        # Skip to start of word if not at one, and find its end
+        word_start, word_end = _SPACE_THEN_WORD_RE.match(para, pos).span(1)
         
-        if pos >= para_len:
+        if word_start >= para_len:
             return
         
-        # Find end of word
-        word_start = pos
-        while pos < para_len and not para[pos].isspace():
-            pos += 1
-        word_end = pos
-        
         # Capitalize first letter, lowercase rest
         word = para[word_start:word_end]
         if word:
@@ -791,126 +894,117 @@ class TextModel:
             )
             self.cursor_position.character_index = word_end
         
-        self.view.render()
+        self._request_render()
     
     def kill_word(self):
         """Delete from cursor to end of current/next word (Emacs M-d)."""
-        para = self.paragraphs[self.cursor_position.paragraph_index]
-        pos = self.cursor_position.character_index
-        para_len = len(para)
+        cp = self.cursor_position
+        para_idx = cp.paragraph_index
+        para = self.paragraphs[para_idx]
+        pos = cp.character_index
         
-        if pos < para_len:
-            end_pos = pos
-            
-            # Skip current word if we're in one
-            while end_pos < para_len and not para[end_pos].isspace():
-                end_pos += 1
-            
-            # Skip whitespace after word
-            while end_pos < para_len and para[end_pos].isspace():
-                end_pos += 1
+        if pos < len(para):
+            # Skip current word if we're in one, then whitespace after it
+            end_pos = _WORD_AND_SPACE_RE.match(para, pos).end()
             
             # Delete from cursor to end_pos
-            self.paragraphs[self.cursor_position.paragraph_index] = para[:pos] + para[end_pos:]
-            style_mask = self.styles[self.cursor_position.paragraph_index]
-            self.styles[self.cursor_position.paragraph_index] = style_mask[:pos] + style_mask[end_pos:]
-        elif self.cursor_position.paragraph_index < len(self.paragraphs) - 1:
+            self.paragraphs[para_idx] = para[:pos] + para[end_pos:]
+            del self.styles[para_idx][pos:end_pos]
+        elif para_idx < len(self.paragraphs) - 1:
             # At end of paragraph, join with next paragraph
             self._join_with_next_paragraph()
         
-        self.view.render()
+        self._request_render()
     
     def backward_kill_word(self):
         """Delete from cursor back to beginning of previous word (Emacs-style)."""
-        para = self.paragraphs[self.cursor_position.paragraph_index]
-        pos = self.cursor_position.character_index
+        cp = self.cursor_position
+        para_idx = cp.paragraph_index
+        para = self.paragraphs[para_idx]
+        original_pos = cp.character_index
         
-        if pos > 0:
-            original_pos = pos
-            # Move back one position to start
-            pos -= 1
-            
-            # Skip whitespace backwards
-            while pos > 0 and para[pos].isspace():
-                pos -= 1
-            
-            # Skip word characters backwards
-            while pos > 0 and not para[pos - 1].isspace():
-                pos -= 1
+        if original_pos > 0:
+            # Skip whitespace backwards, then word characters
+            pos = _word_start_before(para, original_pos)
             
             # Delete from pos to original position
-            self.paragraphs[self.cursor_position.paragraph_index] = para[:pos] + para[original_pos:]
-            style_mask = self.styles[self.cursor_position.paragraph_index]
-            self.styles[self.cursor_position.paragraph_index] = style_mask[:pos] + style_mask[original_pos:]
-            self.cursor_position.character_index = pos
-        elif self.cursor_position.paragraph_index > 0:
+            self.paragraphs[para_idx] = para[:pos] + para[original_pos:]
+            del self.styles[para_idx][pos:original_pos]
+            cp.character_index = pos
+        elif para_idx > 0:
             # At start of paragraph, join with previous paragraph
             self._join_with_previous_paragraph()
         
-        self.view.render()
+        self._request_render()
     
     def delete_char(self):
         """Delete character at cursor position (Emacs-style Ctrl-D)."""
-        para = self.paragraphs[self.cursor_position.paragraph_index]
-        pos = self.cursor_position.character_index
+        cp = self.cursor_position
+        para_idx = cp.paragraph_index
+        para = self.paragraphs[para_idx]
+        pos = cp.character_index
         
         if pos < len(para):
             # Delete character at cursor
-            self.paragraphs[self.cursor_position.paragraph_index] = para[:pos] + para[pos+1:]
-            style_mask = self.styles[self.cursor_position.paragraph_index]
-            self.styles[self.cursor_position.paragraph_index] = style_mask[:pos] + style_mask[pos+1:]
-        elif self.cursor_position.paragraph_index + 1 < len(self.paragraphs):
+            self.paragraphs[para_idx] = para[:pos] + para[pos+1:]
+            del self.styles[para_idx][pos:pos+1]
+        elif para_idx + 1 < len(self.paragraphs):
             # At end of paragraph, join with next paragraph
             self._join_with_next_paragraph()
         # else: at end of document, do nothing
         
-        self.view.render()
+        self._request_render()
     
     def _get_visual_line_info(self):
         """Get information about the current visual line.
 
         Returns:
             Tuple of (line_index, mapper) where mapper is a VisualLineMapper.
+            Mappers are memoized by get_line_mapper, so consecutive
+            Ctrl-A/Ctrl-E/Ctrl-K presses on one paragraph wrap it only once.
         """
-        from .view import get_line_mapper
+        global _get_line_mapper
+        if _get_line_mapper is None:
+            from .view import get_line_mapper as _get_line_mapper
 
         para_idx = self.cursor_position.paragraph_index
         char_idx = self.cursor_position.character_index
         para = self.paragraphs[para_idx]
 
-        mapper = get_line_mapper(para, self.view.num_columns)
+        mapper = _get_line_mapper(para, self.view.num_columns)
         line_index = mapper.line_for_char_index(char_idx)
 
         return line_index, mapper
     
     def move_beginning_of_line(self):
         """Move cursor to beginning of visual line (Emacs-style Ctrl-A)."""
+        cp = self.cursor_position
+        old = (cp.paragraph_index, cp.character_index)
         line_index, mapper = self._get_visual_line_info()
 
         # Calculate the start position of this visual line
-        self.cursor_position.character_index = mapper.line_start(line_index)
+        cp.character_index = mapper.line_start(line_index)
 
         self._update_caret_style_from_position()
-        self.view.render()
+        self._render_if_moved(old)
 
     def move_end_of_line(self):
         """Move cursor to end of visual line (Emacs-style Ctrl-E)."""
+        cp = self.cursor_position
+        old = (cp.paragraph_index, cp.character_index)
         line_index, mapper = self._get_visual_line_info()
 
-        para_idx = self.cursor_position.paragraph_index
-        para = self.paragraphs[para_idx]
-
         # Move to the end of this visual line
         if line_index == mapper.line_count - 1:
             # Last visual line - go to actual end of paragraph
-            self.cursor_position.character_index = len(para)
+            cp.character_index = len(self.paragraphs[cp.paragraph_index])
         else:
             # Not the last line - go to last char of this visual line
             # line_end is the first char of the NEXT line, so subtract 1
-            self.cursor_position.character_index = mapper.line_end(line_index) - 1
+            cp.character_index = mapper.line_end(line_index) - 1
 
         self._update_caret_style_from_position()
-        self.view.render()
+        self._render_if_moved(old)
     
     def start_selection(self):
         """Start a new selection at current cursor position."""
@@ -928,42 +1022,42 @@ class TextModel:
         self.selection_start = None
         self.selection_end = None
     
+    def ordered_selection(self) -> tuple[CursorPosition, CursorPosition]:
+        """Return the selection bounds in document order."""
+        start, end = self.selection_start, self.selection_end
+        if start > end:
+            return end, start
+        return start, end
+
     def update_selection_end(self):
-        """Update the end of selection to current cursor position."""
+        """Update the end of selection to current cursor position and redraw."""
         if self.selection_start is not None:
             self.selection_end = CursorPosition(
                 self.cursor_position.paragraph_index,
                 self.cursor_position.character_index
             )
+            self._request_render()
     
     def get_selected_text(self) -> str:
         """Get the currently selected text."""
-        if self.selection_start is None or self.selection_end is None:
+        if (self.selection_start is None or self.selection_end is None
+                or self.selection_start == self.selection_end):
             return ""
         
         # Ensure start comes before end
-        start = self.selection_start
-        end = self.selection_end
-        if (start.paragraph_index > end.paragraph_index or 
-            (start.paragraph_index == end.paragraph_index and 
-             start.character_index > end.character_index)):
-            start, end = end, start
+        start, end = self.ordered_selection()
         
         # Single paragraph selection
         if start.paragraph_index == end.paragraph_index:
             para = self.paragraphs[start.paragraph_index]
             return para[start.character_index:end.character_index]
         
-        # Multi-paragraph selection
-        result = []
-        for i in range(start.paragraph_index, end.paragraph_index + 1):
-            para = self.paragraphs[i]
-            if i == start.paragraph_index:
-                result.append(para[start.character_index:])
-            elif i == end.paragraph_index:
-                result.append(para[:end.character_index])
-            else:
-                result.append(para)
+        # Multi-paragraph selection: whole paragraphs in between are joined
+        # as they are, so only the two partial ends are sliced
+        first, last = start.paragraph_index, end.paragraph_index
+        result = [self.paragraphs[first][start.character_index:]]
+        result.extend(self.paragraphs[first + 1:last])
+        result.append(self.paragraphs[last][:end.character_index])
         return '\n'.join(result)
     
     def _get_selected_styles(self):
@@ -976,12 +1070,7 @@ class TextModel:
             return None
         
         # Ensure start comes before end
-        start = self.selection_start
-        end = self.selection_end
-        if (start.paragraph_index > end.paragraph_index or 
-            (start.paragraph_index == end.paragraph_index and 
-             start.character_index > end.character_index)):
-            start, end = end, start
+        start, end = self.ordered_selection()
         
         # Single paragraph selection
         if start.paragraph_index == end.paragraph_index:
@@ -989,32 +1078,30 @@ class TextModel:
             return [style_mask[start.character_index:end.character_index]]
         
         # Multi-paragraph selection
-        result = []
-        for i in range(start.paragraph_index, end.paragraph_index + 1):
-            style_mask = self.styles[i]
-            if i == start.paragraph_index:
-                result.append(style_mask[start.character_index:])
-            elif i == end.paragraph_index:
-                result.append(style_mask[:end.character_index])
-            else:
-                result.append(style_mask[:])
+        first, last = start.paragraph_index, end.paragraph_index
+        result = [self.styles[first][start.character_index:]]
+        result.extend(list(row) for row in self.styles[first + 1:last])
+        result.append(self.styles[last][:end.character_index])
         return result
     
     def delete_selection(self):
         """Delete the currently selected text."""
         if self.selection_start is None or self.selection_end is None:
             return
+
+        # Empty selection: nothing to remove or resync
+        if self.selection_start == self.selection_end:
+            start = self.selection_start
+            self.cursor_position = CursorPosition(start.paragraph_index, start.character_index)
+            self.clear_selection()
+            self._request_render()
+            return
         
         # Ensure start comes before end
-        start = self.selection_start
-        end = self.selection_end
-        if (start.paragraph_index > end.paragraph_index or 
-            (start.paragraph_index == end.paragraph_index and 
-             start.character_index > end.character_index)):
-            start, end = end, start
+        start, end = self.ordered_selection()
         
-        # Ensure styles mirror structure
-        self._sync_styles_length()
+        # Ensure the affected styles mirror structure
+        self._sync_style_rows(start.paragraph_index, end.paragraph_index)
 
         # Single paragraph deletion
         if start.paragraph_index == end.paragraph_index:
@@ -1022,31 +1109,28 @@ class TextModel:
             self.paragraphs[start.paragraph_index] = (
                 para[:start.character_index] + para[end.character_index:]
             )
-            style_mask = self.styles[start.paragraph_index]
-            self.styles[start.paragraph_index] = (
-                style_mask[:start.character_index] + style_mask[end.character_index:]
-            )
+            del self.styles[start.paragraph_index][start.character_index:end.character_index]
             self.cursor_position = CursorPosition(start.paragraph_index, start.character_index)
         else:
             # Multi-paragraph deletion
             first_para = self.paragraphs[start.paragraph_index][:start.character_index]
             last_para = self.paragraphs[end.paragraph_index][end.character_index:]
-            first_styles = self.styles[start.paragraph_index][:start.character_index]
-            last_styles = self.styles[end.paragraph_index][end.character_index:]
             
-            # Combine first and last parts
+            # Combine first and last parts; the first mask is cut and
+            # extended in place
             self.paragraphs[start.paragraph_index] = first_para + last_para
-            self.styles[start.paragraph_index] = first_styles + last_styles
+            first_styles = self.styles[start.paragraph_index]
+            del first_styles[start.character_index:]
+            first_styles.extend(self.styles[end.paragraph_index][end.character_index:])
             
             # Delete intermediate paragraphs
-            for _ in range(end.paragraph_index - start.paragraph_index):
-                del self.paragraphs[start.paragraph_index + 1]
-                del self.styles[start.paragraph_index + 1]
+            del self.paragraphs[start.paragraph_index + 1:end.paragraph_index + 1]
+            del self.styles[start.paragraph_index + 1:end.paragraph_index + 1]
             
             self.cursor_position = CursorPosition(start.paragraph_index, start.character_index)
         
         self.clear_selection()
-        self.view.render()
+        self._request_render()
     
     def copy_selection(self):
         """Copy selected text to system clipboard."""
@@ -1066,19 +1150,23 @@ class TextModel:
         return False
     
     def paste(self):
-        """Paste from system clipboard at cursor position, replacing any selection."""
-        if self.selection_start is not None:
-            self.delete_selection()
-        
-        # Get content from system clipboard
-        text, styles = ClipboardManager.paste_text()
-        if text:
-            # If styled clipboard present, insert with styles
-            if styles is not None:
-                parts = text.split('\n')
-                self._insert_text_with_styles(parts, styles)
-            else:
-                self.insert_text(text)
+        """Paste from system clipboard at cursor position, replacing any selection.
+
+        Replacing the selection and inserting render once, together.
+        """
+        with self.batch():
+            if self.selection_start is not None:
+                self.delete_selection()
+
+            # Get content from system clipboard
+            text, styles = ClipboardManager.paste_text()
+            if text:
+                # If styled clipboard present, insert with styles
+                if styles is not None:
+                    parts = text.split('\n')
+                    self._insert_text_with_styles(parts, styles)
+                else:
+                    self.insert_text(text)
     
     def kill_line(self):
         """Delete from cursor to end of visual line (Emacs-style Ctrl-K)."""
@@ -1093,15 +1181,14 @@ class TextModel:
             if para_idx + 1 < len(self.paragraphs):
                 self._join_with_next_paragraph()
             # else: at end of document, nothing to do
-            self.view.render()
+            self._request_render()
             return
 
         # Delete to the end of the current visual line
         visual_line_end = mapper.line_end(line_index)
         if char_idx < visual_line_end:
             self.paragraphs[para_idx] = para[:char_idx] + para[visual_line_end:]
-            style_mask = self.styles[para_idx]
-            self.styles[para_idx] = style_mask[:char_idx] + style_mask[visual_line_end:]
+            del self.styles[para_idx][char_idx:visual_line_end]
             
             # After deleting the last visual line of a multi-line paragraph, if we're now
             # at the end of the paragraph and there's a next paragraph,
@@ -1113,7 +1200,7 @@ class TextModel:
                 self.cursor_position = CursorPosition(para_idx + 1, 0)
         # else: no change
 
-        self.view.render()
+        self._request_render()
 
 
 class DocumentModel:
@@ -1128,8 +1215,4 @@ class DocumentModel:
         self.paragraphs = paragraphs if paragraphs is not None else [""]
 
     def count_words(self) -> int:
-        word_count = 0
-        for paragraph in self.paragraphs:
-            words = paragraph.split()
-            word_count += len(words)
-        return word_count
+        return len('\n'.join(self.paragraphs).split())
@@ -6,13 +6,12 @@ supporting both built-in PDF fonts (Courier) and custom TrueType fonts
 """
 
 import os
-from typing import List, Optional
+from typing import List
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.pdfbase.pdfmetrics import registerFont, Font, EmbeddedType1Face
-from .font_config import get_font_config
+from .font_config import COURIER, PRESTIGE_ELITE
 
 
 class FontLoadError(Exception):
@@ -57,23 +56,13 @@ class PDFGenerator:
         Raises:
             FontLoadError: If the font cannot be configured.
         """
-        config = get_font_config(font_name)
-        
         if font_name == "Courier":
             # Built-in Courier font
-            if config:
-                self.font_name = config.pdf_name
-                self.font_name_bold = config.pdf_bold_name
-                self.font_size = config.point_size
-                self.line_height = config.line_height
-                self.font_embedded = config.is_embedded
-            else:
-                # Fallback (should never happen as Courier is always configured)
-                self.font_name = "Courier"
-                self.font_name_bold = "Courier-Bold"
-                self.font_size = 12
-                self.line_height = 12
-                self.font_embedded = False
+            self.font_name = COURIER.pdf_name
+            self.font_name_bold = COURIER.pdf_bold_name
+            self.font_size = COURIER.point_size
+            self.line_height = COURIER.line_height
+            self.font_embedded = COURIER.is_embedded
                 
         elif font_name == "Prestige Elite Std":
             # Prestige Elite, must be loaded from TTF
@@ -89,9 +78,7 @@ class PDFGenerator:
         Raises:
             FontLoadError: If the font files cannot be found or loaded.
         """
-        config = get_font_config("Prestige Elite Std")
-        if not config:
-            raise FontLoadError("No configuration found for Prestige Elite Std")
+        config = PRESTIGE_ELITE
         
         # Set font configuration
         self.font_name = config.pdf_name
@@ -1,9 +1,7 @@
 """Print dialog UI for document printing."""
 
-from typing import List, Optional, Tuple, NamedTuple
+from typing import List, Optional, NamedTuple
 from enum import Enum
-import blessed
-import os
 import logging
 
 from .print_formatter import PrintFormatter
@@ -47,6 +45,8 @@ class PrintDialog:
         """
         self.model = model
         self.terminal = terminal
+        # Keyboard handler to read input with; created on first show() if unset
+        self.keyboard: Optional[KeyboardHandler] = None
         self.printer_manager = PrinterManager()
         self.session = get_session()
         
@@ -187,7 +187,9 @@ class PrintDialog:
             print(self.terminal.term.hide_cursor, end='', flush=True)
             
             # Use the same input stack as the editor
-            handler = KeyboardHandler(self.terminal)
+            if self.keyboard is None:
+                self.keyboard = KeyboardHandler(self.terminal)
+            handler = self.keyboard
 
             # Apply initial spacing from session if provided
             # Apply initial spacing from session if provided
@@ -8,7 +8,7 @@ output. It supports both 10-pitch (pica) and 12-pitch (elite) font configuration
 from typing import List, Tuple, Optional
 from .view import render_paragraph
 from .view import get_hanging_indent_width
-from .font_config import FontConfig, get_font_config
+from .font_config import COURIER, PRESTIGE_ELITE, FontConfig
 
 
 class PrintFormatter:
@@ -50,34 +50,11 @@ class PrintFormatter:
             self.FULL_PAGE_WIDTH = font_config.full_page_width
         else:
             # Legacy support: derive config from line_length
-            if line_length == 72:
-                # 12-pitch configuration
-                config = get_font_config("Prestige Elite Std")
-                if config:
-                    self.TEXT_WIDTH = config.text_width
-                    self.LEFT_MARGIN = config.left_margin_chars
-                    self.RIGHT_MARGIN = config.right_margin_chars
-                    self.FULL_PAGE_WIDTH = config.full_page_width
-                else:
-                    # Fallback if config not found
-                    self.TEXT_WIDTH = 72
-                    self.LEFT_MARGIN = 15
-                    self.RIGHT_MARGIN = 15
-                    self.FULL_PAGE_WIDTH = 102
-            else:
-                # 10-pitch configuration (default)
-                config = get_font_config("Courier")
-                if config:
-                    self.TEXT_WIDTH = config.text_width
-                    self.LEFT_MARGIN = config.left_margin_chars
-                    self.RIGHT_MARGIN = config.right_margin_chars
-                    self.FULL_PAGE_WIDTH = config.full_page_width
-                else:
-                    # Fallback if config not found
-                    self.TEXT_WIDTH = 65
-                    self.LEFT_MARGIN = 10
-                    self.RIGHT_MARGIN = 10
-                    self.FULL_PAGE_WIDTH = 85
+            config = PRESTIGE_ELITE if line_length == 72 else COURIER
+            self.TEXT_WIDTH = config.text_width
+            self.LEFT_MARGIN = config.left_margin_chars
+            self.RIGHT_MARGIN = config.right_margin_chars
+            self.FULL_PAGE_WIDTH = config.full_page_width
         
         # Parallel to pages: per line list of (start_x, text, flags) runs; None for non-text lines
         self.page_runs: List[List[Optional[List[Tuple[int, str, int]]]]] = []
@@ -4,7 +4,7 @@ import subprocess
 import tempfile
 import os
 import shutil
-from typing import List, Optional
+from typing import List
 
 from .pdf_generator import PDFGenerator
 
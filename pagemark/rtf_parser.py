@@ -1,7 +1,6 @@
 """RTF parsing utilities for clipboard integration."""
 
 from typing import Tuple, Optional, List
-import re
 
 # Maximum RTF size to parse (10MB) to prevent DoS attacks
 MAX_RTF_SIZE = 10 * 1024 * 1024  # 10MB
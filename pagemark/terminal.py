@@ -293,20 +293,20 @@ class TerminalInterface:
             timeout: Timeout in seconds (None for blocking, 0 for non-blocking)
             
         Returns:
-            A key event object; for curtsies, a small shim with __str__.
+            The key as a string (a curtsies token name such as '<LEFT>' or a
+            single character), or None if no key arrived before the timeout.
         """
         if self._curtsies_input is not None:
             # Use select on stdin to implement timeouts
-            if timeout is None:
-                evt = next(self._curtsies_input)  # blocks
-                return str(evt)
-            else:
+            if timeout is not None:
                 t = 0.0 if timeout == 0 else float(timeout)
                 r, _, _ = select.select([sys.stdin], [], [], t)
                 if not r:
                     return None
-                evt = next(self._curtsies_input)
-                return str(evt)
+            evt = next(self._curtsies_input)  # blocks when timeout is None
+            # Key presses already arrive as token strings; only other
+            # events (e.g. paste) need converting
+            return evt if type(evt) is str else str(evt)
         # Curtsies is required; if not initialized, return None
         return None
     
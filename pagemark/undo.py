@@ -13,6 +13,28 @@ class ModelSnapshot:
     selection_end: Optional[tuple[int, int]] = None
 
 
+def share_style_rows(rows: list[list[int]],
+                     previous: Optional[list[list[int]]]) -> list[list[int]]:
+    """Copy style rows for a snapshot, reusing equal rows of a previous one.
+
+    Rows are matched by index and by index from the end, so inserting or
+    deleting paragraphs still shares every row outside the edited range.
+    Callers must treat the returned rows as read-only.
+    """
+    if not previous:
+        return [list(row) for row in rows]
+    shift = len(previous) - len(rows)
+    shared = []
+    for i, row in enumerate(rows):
+        if i < len(previous) and previous[i] == row:
+            shared.append(previous[i])
+        elif shift and 0 <= i + shift < len(previous) and previous[i + shift] == row:
+            shared.append(previous[i + shift])
+        else:
+            shared.append(list(row))
+    return shared
+
+
 @dataclass
 class UndoEntry:
     before: ModelSnapshot
@@ -1,6 +1,8 @@
 from typing import Optional
 from dataclasses import dataclass
 import re
+from bisect import bisect_left
+from functools import lru_cache
 # Provide a no-op override decorator on Python < 3.12
 try:
     from typing import override  # type: ignore
@@ -68,15 +70,17 @@ class VisualLineMapper:
         If char_index exactly equals a line boundary (cumulative_counts[i]),
         it is considered to be at the START of the next line (i+1).
         """
-        # Handle boundary case: exactly at a line end means start of next line
-        for i in range(len(self.cumulative_counts) - 1):
-            if char_index == self.cumulative_counts[i]:
-                return i + 1
-        # Normal case: find first line whose end is past char_index
-        for i, count in enumerate(self.cumulative_counts):
-            if char_index < count:
-                return i
-        return len(self.cumulative_counts) - 1
+        counts = self.cumulative_counts
+        last = len(counts) - 1
+        # Counts are non-decreasing, so binary search for the first line
+        # whose end is at or past char_index
+        i = bisect_left(counts, char_index)
+        if i >= last:
+            return last
+        # Boundary case: exactly at a line end means start of next line
+        if counts[i] == char_index:
+            return i + 1
+        return i
 
     def char_to_line_and_column(self, char_index: int) -> tuple[int, int]:
         """Convert a character index to (line_index, column).
@@ -200,6 +204,11 @@ class VisualLineMapper:
         return self.visual_line_width(line_index) > self.num_columns
 
 
+# Leading spaces, then a bullet or number marker; requiring a non-space
+# after the marker's single space rejects markers followed by several spaces
+_HANGING_INDENT_RE = re.compile(r"^(\s*)(?:([-*\xa0]) (?=\S)|((?:\d+)(?:[\.)]) (?=\S)))")
+
+
 def _get_hanging_indent_width(paragraph: str) -> int:
     """Return hanging indent width for bullet/numbered paragraphs.
 
@@ -210,10 +219,7 @@ def _get_hanging_indent_width(paragraph: str) -> int:
     Returns total columns before first text char (base indent + marker + one space),
     or 0 if not a bullet/numbered paragraph.
     """
-    # Leading spaces
-    # Require exactly one space after the marker by asserting the next
-    # character is non-space. This prevents triggering on multiple spaces.
-    m = re.match(r"^(\s*)(?:([-*\xa0]) (?=\S)|((?:\d+)(?:[\.)]) (?=\S)))", paragraph)
+    m = _HANGING_INDENT_RE.match(paragraph)
     if not m:
         return 0
     leading = m.group(1) or ""
@@ -393,12 +399,17 @@ def render_paragraph(paragraph: str, num_columns: int) -> tuple[list[str], list[
     return (lines, cumulative_counts)
 
 
+@lru_cache(maxsize=256)
 def get_line_mapper(paragraph: str, num_columns: int) -> VisualLineMapper:
     """Create a VisualLineMapper for a paragraph.
 
     This is the preferred way to work with visual line mappings.
     It provides methods to convert between character indices and
     line/column positions.
+
+    Results are memoized on the paragraph text and width, so rendering and
+    cursor motion re-wrap only paragraphs that changed. The returned mapper
+    is shared and must not be modified.
     """
     lines, cumulative_counts = render_paragraph(paragraph, num_columns)
     hanging_width = _get_hanging_indent_width(paragraph)
@@ -426,6 +437,8 @@ class TerminalTextView(TextView):
         # Per-instance mutable state (not shared across instances)
         self.lines: list[str] = []
         self.line_styles: list[list[int]] = []
+        # Wrapped line counts keyed by (paragraph text, num_columns)
+        self._line_counts: dict[tuple[str, int], int] = {}
     
     def _adjust_style_slice_for_hanging_indent(self, style_slice: list[int], 
                                                 is_wrapped_line: bool, 
@@ -489,16 +502,20 @@ class TerminalTextView(TextView):
 
     def _get_paragraph_line_count(self, paragraph_index: int) -> int:
         """Get the number of lines in a rendered paragraph."""
-        para_lines, _ = render_paragraph(self.model.paragraphs[paragraph_index], self.num_columns)
-        return len(para_lines)
-    
+        # Counts are remembered by text, so only paragraphs edited since the
+        # last lookup are wrapped again
+        key = (self.model.paragraphs[paragraph_index], self.num_columns)
+        count = self._line_counts.get(key)
+        if count is None:
+            if len(self._line_counts) > 2 * len(self.model.paragraphs) + 64:
+                self._line_counts.clear()
+            count = self._line_counts[key] = get_line_mapper(*key).line_count
+        return count
+
     def _get_document_line_number(self, paragraph_index: int, line_within_para: int) -> int:
         """Calculate the absolute document line number for a given paragraph and line within it."""
-        doc_line = 0
-        for i in range(paragraph_index):
-            doc_line += self._get_paragraph_line_count(i)
-        doc_line += line_within_para
-        return doc_line
+        count = self._get_paragraph_line_count
+        return sum(count(i) for i in range(paragraph_index)) + line_within_para
 
     @override
     def get_selection_ranges(self):
@@ -511,12 +528,7 @@ class TerminalTextView(TextView):
             return None
 
         # Get normalized selection bounds
-        start = self.model.selection_start
-        end = self.model.selection_end
-        if (start.paragraph_index > end.paragraph_index or
-            (start.paragraph_index == end.paragraph_index and
-             start.character_index > end.character_index)):
-            start, end = end, start
+        start, end = self.model.ordered_selection()
 
         selection_ranges = []
         current_para_idx = self.start_paragraph_index
@@ -577,6 +589,8 @@ class TerminalTextView(TextView):
     
     def render(self):
         paragraph_index = self.start_paragraph_index
+        # Probe the model once; the line loops below read this local
+        model_styles = getattr(self.model, 'styles', None)
         # First paragraph
         para = self.model.paragraphs[paragraph_index]
         mapper = get_line_mapper(para, self.num_columns)
@@ -610,7 +624,7 @@ class TerminalTextView(TextView):
             # Build style line from model.styles and paragraph boundaries
             start_ci = mapper.line_start(line_index)
             end_ci = mapper.line_end(line_index)
-            st = self.model.styles[paragraph_index] if hasattr(self.model, 'styles') else []
+            st = model_styles[paragraph_index] if model_styles is not None else []
             style_slice = st[start_ci:end_ci] if st else [0] * len(line_text)
             # Account for hanging indent padding on wrapped lines
             style_slice = self._adjust_style_slice_for_hanging_indent(style_slice, line_index > 0, para)
@@ -650,7 +664,7 @@ class TerminalTextView(TextView):
                 # Add the actual content line
                 line_text = mapper.lines[i]
                 self.lines.append(line_text)
-                st = self.model.styles[paragraph_index] if hasattr(self.model, 'styles') else []
+                st = model_styles[paragraph_index] if model_styles is not None else []
                 start_ci = mapper.line_start(i)
                 end_ci = mapper.line_end(i)
                 style_slice = st[start_ci:end_ci] if st else [0] * len(line_text)
@@ -700,16 +714,12 @@ class TerminalTextView(TextView):
         # Get document line number at start of view
         doc_line_start = self._get_document_line_number(self.start_paragraph_index, self.first_paragraph_line_offset)
 
-        # Calculate the cursor's document line number
-        cursor_doc_line = 0
-        for i in range(cursor_para_idx):
-            cursor_doc_line += self._get_paragraph_line_count(i)
-
         # Use VisualLineMapper to find line index and column
         mapper = get_line_mapper(self.model.paragraphs[cursor_para_idx], self.num_columns)
         line_index = mapper.line_for_char_index(char_idx)
 
-        cursor_doc_line += line_index
+        # Calculate the cursor's document line number
+        cursor_doc_line = self._get_document_line_number(cursor_para_idx, line_index)
 
         # Calculate number of page breaks between start of view and cursor
         page_breaks_before = 0
@@ -874,6 +884,8 @@ class TerminalTextView(TextView):
     
     def _document_line_to_paragraph(self, doc_line: int) -> tuple[int, int]:
         """Convert document line number to paragraph index and line within paragraph."""
+        # Line counts are cached, so this walk stops at the target paragraph
+        # without wrapping any text
         current_line = 0
         for para_idx in range(len(self.model.paragraphs)):
             para_line_count = self._get_paragraph_line_count(para_idx)
@@ -958,10 +970,7 @@ class TerminalTextView(TextView):
 
     # --- Paging (Emacs-style C-v / M-v) ---
     def _total_document_lines(self) -> int:
-        total = 0
-        for i in range(len(self.model.paragraphs)):
-            total += self._get_paragraph_line_count(i)
-        return total
+        return self._get_document_line_number(len(self.model.paragraphs), 0)
 
     def _page_breaks_between(self, start_doc_line: int, end_doc_line_exclusive: int) -> int:
         """Count page break lines that would be inserted between start (inclusive)
@@ -987,13 +996,10 @@ class TerminalTextView(TextView):
     def _cursor_doc_line(self) -> int:
         """Compute the document line where the cursor is (counting content lines only)."""
         cursor_para_idx = self.model.cursor_position.paragraph_index
-        doc_line = 0
-        for i in range(cursor_para_idx):
-            doc_line += self._get_paragraph_line_count(i)
         # Which wrapped line contains the cursor
         mapper = get_line_mapper(self.model.paragraphs[cursor_para_idx], self.num_columns)
         line_idx = mapper.line_for_char_index(self.model.cursor_position.character_index)
-        return doc_line + line_idx
+        return self._get_document_line_number(cursor_para_idx, line_idx)
 
     def _set_cursor_to_doc_line_start(self, doc_line: int) -> None:
         """Set cursor to the start of a document line."""
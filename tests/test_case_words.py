@@ -0,0 +1,35 @@
+"""Test Emacs-style word case commands (M-u, M-l)."""
+
+from unittest.mock import Mock
+from pagemark.model import TextModel, CursorPosition
+
+
+def _model(text, char_index):
+    view = Mock()
+    view.start_paragraph_index = 0
+    view.end_paragraph_index = 10
+    m = TextModel(view, paragraphs=[text])
+    m.cursor_position = CursorPosition(0, char_index)
+    return m
+
+
+def test_upcase_word_from_cursor():
+    m = _model("hello world", 2)
+    m.upcase_word()
+    assert m.paragraphs == ["heLLO world"]
+    assert m.cursor_position.character_index == 5
+
+
+def test_downcase_word_skips_whitespace():
+    m = _model("ONE   TWO", 3)
+    m.downcase_word()
+    assert m.paragraphs == ["ONE   two"]
+    assert m.cursor_position.character_index == 9
+
+
+def test_word_already_in_case_only_moves_cursor():
+    m = _model("done here", 0)
+    before = m.paragraphs[0]
+    m.downcase_word()
+    assert m.paragraphs[0] is before
+    assert m.cursor_position.character_index == 4
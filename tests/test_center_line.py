@@ -51,6 +51,36 @@ def test_center_line_with_existing_spaces():
     assert model.cursor_position.character_index == expected_spaces + 1
 
 
+def test_center_line_keeps_styles_with_text():
+    """Styles move with the characters; padding is unstyled."""
+    view = create_mock_view()
+    model = TextModel(view, paragraphs=["  ab  "])
+    model.styles[0] = [0, 0, 1, 2, 0, 0]
+    model.cursor_position = CursorPosition(0, 6)  # In the trailing spaces
+
+    assert model.center_line()
+
+    spaces = (65 - 2) // 2
+    assert model.paragraphs[0] == ' ' * spaces + "ab"
+    assert model.styles[0] == [0] * spaces + [1, 2]
+    assert model.cursor_position.character_index == spaces + 2
+
+
+def test_center_line_keeps_styles_when_padding_shrinks():
+    """Styles stay aligned when the old indent is wider than the new one."""
+    view = create_mock_view()
+    view.num_columns = 20
+    model = TextModel(view, paragraphs=[' ' * 30 + "hi"])
+    model.styles[0][30:32] = [1, 1]
+    model.cursor_position = CursorPosition(0, 31)
+
+    assert model.center_line()
+
+    assert model.paragraphs[0] == ' ' * 9 + "hi"
+    assert model.styles[0] == [0] * 9 + [1, 1]
+    assert model.cursor_position.character_index == 10
+
+
 def test_center_multi_line_paragraph_fails():
     """Test that centering fails for multi-line paragraphs."""
     view = create_mock_view()
@@ -19,7 +19,6 @@ class TestCtrlCHandling(unittest.TestCase):
         editor.model.selection_start = CursorPosition(0, 0)
         editor.model.selection_end = CursorPosition(0, 5)
         editor.model.paragraphs = ["Test text"]
-        editor.model.clipboard = ""
         
         # Create Ctrl-C event
         ctrl_c_event = KeyEvent(
@@ -43,7 +42,6 @@ class TestCtrlCHandling(unittest.TestCase):
         editor.model.selection_start = CursorPosition(0, 0)
         editor.model.selection_end = CursorPosition(0, 5)
         editor.model.paragraphs = ["Test text"]
-        editor.model.clipboard = ""
         
         # The main loop should handle KeyboardInterrupt
         # This test verifies the exception handling logic exists
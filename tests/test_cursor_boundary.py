@@ -54,4 +54,32 @@ def test_cursor_down_reaches_last_wrapped_line():
     
     # Should move to line 1
     assert view.visual_cursor_y == 1, f"After down arrow, should be at line 1, got {view.visual_cursor_y}"
-    assert view.visual_cursor_x == 0, f"Should be at column 0, got {view.visual_cursor_x}"
\ No newline at end of file
+    assert view.visual_cursor_x == 0, f"Should be at column 0, got {view.visual_cursor_x}"
+
+
+def test_motion_at_document_edge_skips_render():
+    """Motions that cannot move the cursor do not repaint the view."""
+    from unittest.mock import Mock
+    from pagemark.model import CursorPosition
+
+    view = TerminalTextView()
+    view.num_rows = 10
+    view.num_columns = 65
+    model = TextModel(view, paragraphs=["first", "last"])
+    view.render = Mock()
+
+    model.cursor_position = CursorPosition(1, 4)
+    model.right_char()
+    model.right_word()
+    model.move_end_of_line()
+    view.render.assert_not_called()
+
+    model.cursor_position = CursorPosition(0, 0)
+    model.left_char()
+    model.left_word()
+    model.move_beginning_of_line()
+    view.render.assert_not_called()
+
+    model.right_char()
+    assert model.cursor_position == CursorPosition(0, 1)
+    view.render.assert_called_once()
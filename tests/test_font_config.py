@@ -5,6 +5,8 @@ from pagemark.font_config import (
     FontConfig, 
     get_font_config, 
     FONT_CONFIGS,
+    COURIER,
+    PRESTIGE_ELITE,
     LETTER_WIDTH_INCHES,
     STANDARD_MARGIN_INCHES,
     NARROW_MARGIN_INCHES
@@ -87,6 +89,13 @@ class TestFontConfig(unittest.TestCase):
         with self.assertRaises(AttributeError):
             config.text_width = 100
             
+    def test_font_configs_read_only(self):
+        """Test that the FONT_CONFIGS registry cannot be mutated."""
+        with self.assertRaises(TypeError):
+            FONT_CONFIGS["Courier"] = PRESTIGE_ELITE
+        self.assertIs(FONT_CONFIGS["Courier"], COURIER)
+        self.assertIs(get_font_config("Prestige Elite Std"), PRESTIGE_ELITE)
+            
     def test_pdf_names(self):
         """Test PDF font names are set correctly."""
         courier = get_font_config("Courier")
@@ -135,6 +135,42 @@ def test_escape_key_is_not_alt():
     assert event.value == 'f'
 
 
+def test_esc_prefixed_tokens_are_alt():
+    """Curtsies assembles ESC-prefixed sequences into Esc+/Meta- tokens."""
+    terminal = MockTerminal()
+    handler = KeyboardHandler(terminal)
+
+    for token, value in [('<Esc+b>', 'b'), ('<Esc+LEFT>', 'left'),
+                         ('<Meta-RIGHT>', 'right'), ('<Esc+BACKSPACE>', 'backspace')]:
+        terminal.add_key(token)
+        event = handler.get_key_event()
+        assert event.key_type == KeyType.ALT, token
+        assert event.value == value
+        assert event.is_alt == True
+
+
+def test_token_table_covers_curtsies_names():
+    """Every token curtsies can emit resolves through the precomputed table."""
+    events = pytest.importorskip('curtsies.events')
+    from pagemark.keyboard import _TOKEN_TABLE
+
+    missing = sorted(set(events.CURTSIES_NAMES.values()) - set(_TOKEN_TABLE))
+    assert missing == []
+
+
+def test_key_event_immutable():
+    """Shared KeyEvents are frozen and carry no per-instance __dict__."""
+    terminal = MockTerminal()
+    handler = KeyboardHandler(terminal)
+
+    event = handler.parse_key('<LEFT>')
+    with pytest.raises(AttributeError):
+        event.value = 'right'
+    assert not hasattr(event, '__dict__')
+    assert hash(event) == hash(KeyEvent(key_type=KeyType.SPECIAL, value='left',
+                                        raw='<LEFT>', is_sequence=True))
+
+
 def test_esc_alone():
     """Test ESC key by itself (no following key)."""
     terminal = MockTerminal()
@@ -268,3 +304,35 @@ def test_no_key_available():
     # No keys in queue
     event = handler.get_key_event(timeout=0)
     assert event is None
+
+
+def test_repeated_tokens_are_cached():
+    """Repeated special tokens reuse the parsed event; regular chars do not."""
+    terminal = MockTerminal()
+    handler = KeyboardHandler(terminal)
+
+    first = handler.parse_key('<Ctrl-a>')
+    second = handler.parse_key('<Ctrl-a>')
+    assert first is second
+    assert second.key_type == KeyType.CTRL
+    assert second.value == 'a'
+
+    handler.parse_key('x')
+    assert 'x' not in handler._parse_cache
+
+
+def test_parse_cache_holds_only_unlisted_tokens():
+    """Table tokens come from the shared table; others are cached, bounded."""
+    from pagemark.keyboard import _TOKEN_TABLE
+    handler = KeyboardHandler(MockTerminal())
+
+    assert handler.parse_key('<Ctrl-a>') is _TOKEN_TABLE['<Ctrl-a>']
+    assert handler._parse_cache == {}
+
+    first = handler.parse_key('<F13>')
+    assert handler.parse_key('<F13>') is first
+    assert list(handler._parse_cache) == ['<F13>']
+
+    handler.PARSE_CACHE_LIMIT = 1
+    handler.parse_key('<F14>')
+    assert list(handler._parse_cache) == ['<F14>']
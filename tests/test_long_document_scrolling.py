@@ -128,3 +128,26 @@ def test_multiline_paragraphs_deep_cursor_no_recursion():
 
     # Verify cursor is now visible
     assert view.start_paragraph_index <= model.cursor_position.paragraph_index
+
+
+def test_document_line_mapping_reuses_wrapped_counts():
+    """Paragraph line counts are wrapped once and stay correct after edits."""
+    from unittest.mock import patch
+    import pagemark.view as view_module
+
+    view, model = create_long_document_view(num_paragraphs=50, multiline=True)
+    line_counts = [view_module.get_line_mapper(p, view.num_columns).line_count
+                   for p in model.paragraphs]
+
+    for doc_line in (0, 1, line_counts[0], sum(line_counts[:10]) + 1):
+        para_idx, line_in_para = view._document_line_to_paragraph(doc_line)
+        assert view._get_document_line_number(para_idx, line_in_para) == doc_line
+
+    with patch.object(view_module, 'render_paragraph',
+                      wraps=view_module.render_paragraph) as wrapped:
+        assert view._total_document_lines() == sum(line_counts)
+        assert wrapped.call_count == 0
+
+        model.paragraphs[3] = 'short'
+        assert view._total_document_lines() == sum(line_counts) - line_counts[3] + 1
+        assert wrapped.call_count == 1
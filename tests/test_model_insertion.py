@@ -166,3 +166,161 @@ def test_insert_with_position_parameter():
     # Cursor moved based on the insertion at cursor position
     assert m.cursor_position.paragraph_index == 1
     assert m.cursor_position.character_index == 3  # After "YYY"
+
+
+def test_insert_single_line_keeps_lists_and_styles():
+    """Text without newlines is inserted in place with the caret style."""
+    v = TerminalTextView()
+    v.num_rows = 10
+    v.num_columns = 80
+    m = TextModel(v, paragraphs=["first", "second", "third"])
+    paragraphs = m.paragraphs
+    m.cursor_position = CursorPosition(1, 3)
+    m.caret_style = m.STYLE_BOLD
+
+    m.insert_text("XY")
+
+    assert m.paragraphs is paragraphs
+    assert m.paragraphs == ["first", "secXYond", "third"]
+    assert m.styles[1] == [0, 0, 0, m.STYLE_BOLD, m.STYLE_BOLD, 0, 0, 0]
+    assert m.cursor_position == CursorPosition(1, 5)
+
+
+def test_edits_do_not_touch_pasted_style_rows():
+    """Style rows handed in for a paste are copied, not shared."""
+    v = TerminalTextView()
+    v.num_rows = 10
+    v.num_columns = 80
+    m = TextModel(v, paragraphs=[""])
+    parts = ["ab", "cd", "ef"]
+    parts_styles = [[1, 1], [2, 2], [0, 0]]
+
+    m._insert_text_with_styles(parts, parts_styles)
+    m.cursor_position = CursorPosition(1, 1)
+    m.insert_text("X")
+    m.backspace()
+    m.backspace()
+
+    assert m.paragraphs == ["ab", "d", "ef"]
+    assert parts_styles == [[1, 1], [2, 2], [0, 0]]
+
+
+def test_single_char_insert_repairs_stale_style_row():
+    """A paragraph replaced without its mask still gets a matching one."""
+    v = TerminalTextView()
+    v.num_rows = 10
+    v.num_columns = 80
+    m = TextModel(v, paragraphs=["abc"])
+    m.paragraphs[0] = "abcdef"
+    m.cursor_position = CursorPosition(0, 6)
+
+    m.insert_text("g")
+
+    assert m.paragraphs == ["abcdefg"]
+    assert len(m.styles[0]) == 7
+
+
+def test_insert_repairs_only_the_rows_it_edits():
+    """Pasting across lines fixes the edited mask without scanning others."""
+    v = TerminalTextView()
+    v.num_rows = 10
+    v.num_columns = 80
+    m = TextModel(v, paragraphs=["ab", "cd", "ef"])
+    m.paragraphs[0] = "abc"
+    m.paragraphs[2] = "efgh"
+    untouched = m.styles[2]
+    m.cursor_position = CursorPosition(0, 3)
+
+    m.insert_text("x\ny")
+
+    assert m.paragraphs == ["abcx", "y", "cd", "efgh"]
+    assert m.styles[:2] == [[0] * 4, [0]]
+    assert m.styles[3] is untouched
+
+
+def test_multi_paragraph_insert_styles():
+    """Inserted rows take the caret style; text around the cursor keeps its own."""
+    v = TerminalTextView()
+    v.num_rows = 10
+    v.num_columns = 80
+    m = TextModel(v, paragraphs=["abcd"])
+    m.styles[0] = [1, 1, 2, 2]
+    m.cursor_position = CursorPosition(0, 2)
+    m.caret_style = 0
+
+    m.insert_text("X\nYY\nZ")
+
+    assert m.paragraphs == ["abX", "YY", "Zcd"]
+    assert m.styles == [[1, 1, 0], [0, 0], [0, 2, 2]]
+    assert m.cursor_position == CursorPosition(2, 1)
+
+
+def test_batch_renders_once():
+    """Model edits inside batch() share a single render on exit."""
+    from unittest.mock import Mock
+
+    v = TerminalTextView()
+    v.num_rows = 10
+    v.num_columns = 80
+    m = TextModel(v, paragraphs=["hello world"])
+    v.render = Mock()
+    m.selection_start = CursorPosition(0, 0)
+    m.selection_end = CursorPosition(0, 5)
+
+    with m.batch():
+        m.delete_selection()
+        m.insert_text("howdy")
+        with m.batch():
+            m.right_char()
+        v.render.assert_not_called()
+
+    v.render.assert_called_once()
+    assert m.paragraphs == ["howdy world"]
+
+
+def test_default_models_share_no_state():
+    """Models built without paragraphs get their own list and cursor."""
+    models = []
+    for _ in range(2):
+        v = TerminalTextView()
+        v.num_rows = 10
+        v.num_columns = 80
+        models.append(TextModel(v))
+    a, b = models
+    a.insert_text("x")
+
+    assert b.paragraphs == [""]
+    assert a.paragraphs is not b.paragraphs
+    assert a.cursor_position is not b.cursor_position
+    assert b.cursor_position == CursorPosition(0, 0)
+
+
+def test_model_state_uses_slots():
+    """Model and cursor objects keep their state in slots, not a __dict__."""
+    v = TerminalTextView()
+    v.num_rows = 10
+    v.num_columns = 80
+    m = TextModel(v, paragraphs=["abc"])
+
+    assert not hasattr(m, '__dict__')
+    assert not hasattr(m.cursor_position, '__dict__')
+    assert m.STYLE_BOLD == 1 and m.STYLE_UNDER == 2
+
+
+def test_insert_empty_text_is_a_no_op():
+    """Inserting an empty string changes nothing and does not redraw."""
+    from unittest.mock import Mock
+
+    v = TerminalTextView()
+    v.num_rows = 10
+    v.num_columns = 80
+    m = TextModel(v, paragraphs=["abc"])
+    m.cursor_position = CursorPosition(0, 1)
+    v.render = Mock()
+
+    m.insert_text("")
+
+    v.render.assert_not_called()
+    assert m.paragraphs == ["abc"]
+    assert m.styles == [[0, 0, 0]]
+    assert m.cursor_position == CursorPosition(0, 1)
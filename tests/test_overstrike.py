@@ -0,0 +1,47 @@
+"""Test overstrike serialization of bold and underline styles."""
+
+from pagemark.model import TextModel, StyleFlags
+from pagemark.view import TerminalTextView
+
+
+def _view():
+    v = TerminalTextView()
+    v.num_rows = 10
+    v.num_columns = 80
+    return v
+
+
+def test_to_overstrike_encodes_style_runs():
+    m = TextModel(_view(), paragraphs=["plain bold under both", "none"])
+    B, U = StyleFlags.BOLD, StyleFlags.UNDERLINE
+    m.styles[0] = [0] * 6 + [B] * 4 + [0] + [U] * 5 + [0] + [B | U] * 4
+    # A short mask leaves the remaining characters unstyled
+    m.styles[1] = [B, B]
+
+    assert m.to_overstrike_text() == (
+        "plain "
+        "b\bbo\bol\bld\bd"
+        " "
+        "_\bu_\bn_\bd_\be_\br"
+        " "
+        "_\bb\bb_\bo\bo_\bt\bt_\bh\bh"
+        "\n"
+        "n\bno\bone"
+    )
+
+
+def test_overstrike_round_trip():
+    B, U = StyleFlags.BOLD, StyleFlags.UNDERLINE
+    m = TextModel(_view(), paragraphs=["a_b", "", "x\by", "_c"])
+    m.styles = [[B, U, B | U], [], [0, 0, 0], [U, B]]
+
+    loaded = TextModel.from_overstrike_text(_view(), m.to_overstrike_text())
+
+    assert loaded.paragraphs == m.paragraphs
+    assert loaded.styles == m.styles
+
+
+def test_parse_overstrike_tolerates_stray_backspaces():
+    assert TextModel._parse_overstrike_paragraph("_\ba\bb") == ("a\bb", [StyleFlags.UNDERLINE, 0, 0])
+    assert TextModel._parse_overstrike_paragraph("ab\b") == ("ab\b", [0, 0, 0])
+    assert TextModel._parse_overstrike_paragraph("plain") == ("plain", [0] * 5)
@@ -178,4 +178,10 @@ def test_get_page_count():
     # Empty document
     formatter3 = PrintFormatter([])
     formatter3.format_pages()
-    assert formatter3.get_page_count() == 0
\ No newline at end of file
+    assert formatter3.get_page_count() == 0
+
+
+def test_get_page_runs_before_formatting():
+    """Page runs are empty until pages have been formatted."""
+    formatter = PrintFormatter(["a"])
+    assert formatter.get_page_runs() == []
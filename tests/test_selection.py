@@ -21,6 +21,22 @@ class TestSelection(unittest.TestCase):
             "jumps over the lazy dog"
         ])
         
+    def test_cursor_position_document_order(self):
+        """Positions compare by paragraph first, then character."""
+        self.assertLess(CursorPosition(0, 9), CursorPosition(1, 0))
+        self.assertLess(CursorPosition(1, 2), CursorPosition(1, 3))
+        self.assertGreaterEqual(CursorPosition(1, 3), CursorPosition(1, 3))
+        self.assertGreater(CursorPosition(2, 0), CursorPosition(1, 50))
+        self.assertLessEqual(CursorPosition(0, 0), CursorPosition(0, 1))
+
+    def test_ordered_selection(self):
+        """Selection bounds come back in document order."""
+        self.model.selection_start = CursorPosition(1, 3)
+        self.model.selection_end = CursorPosition(0, 9)
+        self.assertEqual(self.model.ordered_selection(),
+                         (CursorPosition(0, 9), CursorPosition(1, 3)))
+        self.assertEqual(self.model.get_selected_text(), " brown fox\njum")
+
     def test_selection_start(self):
         """Test starting a selection."""
         self.model.cursor_position = CursorPosition(0, 4)  # At "quick"
@@ -109,6 +125,21 @@ class TestSelection(unittest.TestCase):
         self.assertEqual(self.model.paragraphs[0], "The fastquick brown fox")
         self.assertEqual(self.model.cursor_position.character_index, 8)
     
+    def test_paste_over_selection_renders_once(self):
+        """Replacing a selection with pasted text draws the view once."""
+        self.model.cursor_position = CursorPosition(0, 4)
+        self.model.start_selection()
+        self.model.cursor_position = CursorPosition(0, 9)
+        self.model.update_selection_end()
+        self.mock_view.render.reset_mock()
+
+        with patch('pagemark.model.ClipboardManager.paste_text',
+                   return_value=("slow", None)):
+            self.model.paste()
+
+        self.assertEqual(self.model.paragraphs[0], "The slow brown fox")
+        self.assertEqual(self.mock_view.render.call_count, 1)
+
     def test_paste_plain_text_only(self):
         """Test pasting plain text from system clipboard."""
         # Currently only plain text is supported
@@ -144,6 +175,49 @@ class TestSelection(unittest.TestCase):
         self.assertIsNone(self.model.selection_start)
         self.assertIsNone(self.model.selection_end)
 
+    def test_empty_selection(self):
+        """A zero-length selection yields no text and deletes nothing."""
+        self.model.cursor_position = CursorPosition(1, 5)
+        self.model.start_selection()
+        self.model.update_selection_end()
+
+        self.assertEqual(self.model.get_selected_text(), "")
+        self.assertFalse(self.model.copy_selection())
+
+        self.model.delete_selection()
+        self.assertEqual(self.model.paragraphs, [
+            "The quick brown fox",
+            "jumps over the lazy dog"
+        ])
+        self.assertEqual(self.model.cursor_position, CursorPosition(1, 5))
+        self.assertIsNone(self.model.selection_start)
+
+    def test_delete_multi_paragraph_selection_keeps_styles(self):
+        """Styles on both sides of a cross-paragraph deletion survive."""
+        self.model.styles[0][0:3] = [1, 1, 1]      # "The"
+        self.model.styles[1][20:23] = [2, 2, 2]    # "dog"
+        self.model.selection_start = CursorPosition(0, 3)
+        self.model.selection_end = CursorPosition(1, 19)
+
+        self.model.delete_selection()
+
+        self.assertEqual(self.model.paragraphs, ["The dog"])
+        self.assertEqual(self.model.styles, [[1, 1, 1, 0, 2, 2, 2]])
+
+    def test_shift_movement_renders_once(self):
+        """Shift+arrow moves, extends the selection and draws it once."""
+        from pagemark.commands import ShiftRightCommand
+        editor = Mock()
+        editor.model = self.model
+        editor.view = self.mock_view
+        self.model.cursor_position = CursorPosition(0, 4)
+
+        ShiftRightCommand().execute(editor, None)
+
+        self.assertEqual(self.model.selection_start, CursorPosition(0, 4))
+        self.assertEqual(self.model.selection_end, CursorPosition(0, 5))
+        self.mock_view.render.assert_called_once()
+
 
 
 
@@ -0,0 +1,42 @@
+"""Test Emacs-style transpose_words (M-t)."""
+
+import pytest
+from pagemark.model import TextModel, CursorPosition
+from pagemark.view import TerminalTextView
+
+
+def _model(text, char_index):
+    v = TerminalTextView()
+    v.num_rows = 10
+    v.num_columns = 80
+    m = TextModel(v, paragraphs=[text])
+    m.cursor_position = CursorPosition(0, char_index)
+    return m
+
+
+@pytest.mark.parametrize("text,pos,expected", [
+    ("one two three", 1, "two one three"),    # inside the first word
+    ("one two three", 3, "two one three"),    # right after a word
+    ("one  two three", 4, "two  one three"),  # between words
+    ("  one two", 0, "  two one"),            # before the first word
+    ("one two three", 13, "one three two"),   # after the last word
+    ("one two, three.", 9, "one three, two."),
+])
+def test_transpose_words(text, pos, expected):
+    m = _model(text, pos)
+    m.transpose_words()
+    assert m.paragraphs == [expected]
+
+
+def test_transpose_words_keeps_styles_with_words():
+    m = _model("ab cde", 0)
+    m.styles[0] = [1, 1, 0, 2, 2, 2]
+    m.transpose_words()
+    assert m.paragraphs == ["cde ab"]
+    assert m.styles == [[2, 2, 2, 0, 1, 1]]
+
+
+def test_transpose_words_needs_two_words():
+    m = _model("  lonely  ", 4)
+    m.transpose_words()
+    assert m.paragraphs == ["  lonely  "]
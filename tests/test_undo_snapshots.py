@@ -0,0 +1,31 @@
+"""Test snapshot sharing between undo entries."""
+
+from pagemark.editor import Editor
+from pagemark.keyboard import KeyEvent, KeyType
+
+
+def _type(editor, text):
+    for ch in text:
+        editor._handle_key_event(KeyEvent(key_type=KeyType.REGULAR, value=ch, raw=ch))
+
+
+def test_snapshots_share_unchanged_style_rows():
+    editor = Editor()
+    editor.model.paragraphs = ["one", "two", "three"]
+    editor.model.styles = [[0] * 3, [1] * 3, [2] * 5]
+    editor.model.cursor_position.character_index = 3
+    _type(editor, "x")
+    editor._handle_key_event(KeyEvent(key_type=KeyType.SPECIAL, value='enter', raw='<ENTER>', is_sequence=True))
+    assert editor.model.paragraphs == ["onex", "", "two", "three"]
+
+    typing, newline = editor.undo._undo_stack
+    # Rows after the inserted paragraph are shared across its snapshots
+    assert newline.before.styles[-1] is newline.after.styles[-1]
+    assert newline.before.styles[1] is typing.after.styles[1]
+    assert editor.model.styles[-1] is not newline.after.styles[-1]
+
+    editor.model.styles[-1][0] = 0
+    editor.undo.undo(editor)
+    editor.undo.undo(editor)
+    assert editor.model.paragraphs == ["one", "two", "three"]
+    assert editor.model.styles == [[0] * 3, [1] * 3, [2] * 5]
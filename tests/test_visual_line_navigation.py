@@ -1,7 +1,7 @@
 """Test Ctrl-A/E work with visual lines (wrapped text)."""
 
 from pagemark.model import TextModel, CursorPosition
-from pagemark.view import TerminalTextView
+from pagemark.view import TerminalTextView, VisualLineMapper
 
 
 def test_move_beginning_of_visual_line():
@@ -309,3 +309,59 @@ def test_move_in_short_line():
     # Move to end
     model.move_end_of_line()
     assert model.cursor_position.character_index == len(short_text)
+
+
+def test_line_layout_reused_until_text_or_width_changes():
+    """Ctrl-A then Ctrl-E on one paragraph wraps it only once."""
+    view = TerminalTextView()
+    view.num_columns = 20
+    view.num_rows = 10
+    model = TextModel(view, paragraphs=["This is a very long line that will definitely wrap around"])
+    model.cursor_position = CursorPosition(0, 25)
+
+    _, first = model._get_visual_line_info()
+    model.move_beginning_of_line()
+    _, second = model._get_visual_line_info()
+    assert first is second
+
+    model.paragraphs[0] = "Short now"
+    model.styles[0] = [0] * len(model.paragraphs[0])
+    model.cursor_position = CursorPosition(0, 3)
+    _, edited = model._get_visual_line_info()
+    assert edited is not first
+    assert edited.lines == ["Short now"]
+
+    view.num_columns = 5
+    _, narrow = model._get_visual_line_info()
+    assert narrow is not edited
+    assert narrow.num_columns == 5
+
+
+def test_line_for_char_index_boundaries():
+    """A char index equal to a line end belongs to the next line."""
+    mapper = VisualLineMapper(lines=["a", "b", "c"], cumulative_counts=[20, 40, 57])
+    assert mapper.line_for_char_index(0) == 0
+    assert mapper.line_for_char_index(19) == 0
+    assert mapper.line_for_char_index(20) == 1
+    assert mapper.line_for_char_index(39) == 1
+    assert mapper.line_for_char_index(40) == 2
+    # The paragraph end stays on the last line
+    assert mapper.line_for_char_index(57) == 2
+    assert mapper.line_for_char_index(99) == 2
+
+
+def test_render_reuses_wrapped_paragraphs():
+    """Redrawing unchanged paragraphs does not wrap them again."""
+    from unittest.mock import patch
+    import pagemark.view as view_module
+
+    view = TerminalTextView()
+    view.num_columns = 20
+    view.num_rows = 10
+    TextModel(view, paragraphs=["A paragraph that wraps over lines", "and a second one"])
+    view.render()
+
+    with patch.object(view_module, 'render_paragraph', wraps=view_module.render_paragraph) as wrapped:
+        view.render()
+        view.move_cursor_down()
+        assert wrapped.call_count == 0
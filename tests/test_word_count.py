@@ -88,3 +88,19 @@ def test_word_count_command_through_registry():
     command = registry.get_command(KeyType.CTRL, 'w')
     assert command is not None
     assert isinstance(command, WordCountCommand)
+
+
+def test_text_model_word_count_tracks_edits():
+    """Cached per-paragraph counts follow edits to the text."""
+    from pagemark.model import TextModel, CursorPosition
+    from pagemark.view import TerminalTextView
+
+    model = TextModel(TerminalTextView(), paragraphs=["one two", "three"])
+    assert model.count_words() == 3
+
+    model.cursor_position = CursorPosition(1, 5)
+    model.insert_text(" four five")
+    assert model.count_words() == 5
+
+    model.paragraphs = ["just one"]
+    assert model.count_words() == 2